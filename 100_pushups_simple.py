@@ -14,17 +14,39 @@ FUTURE EXPANSION IDEAS:
 - Enhanced User Interface (graphical or web-based) for improved usability.
 """
 
+import atexit
 import csv
+import gc
+import hashlib
+import io
+import json
+import math
+import multiprocessing
 import os
+import queue
+import threading
 import time
 import random
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import accumulate
 
 try:
     import matplotlib.pyplot as plt
 except ImportError:
     plt = None  # Matplotlib may not be available; this variable remains None if so
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional; rescore_attempts() falls back to pure Python without it
+
 # -- GLOBAL / CUSTOMIZABLE SETTINGS --
 
 PLAN_CSV = "100_pushups_plan.csv"                # Path to the plan CSV
@@ -35,79 +57,887 @@ ATTEMPT_LOG_CSV = "100_pushups_attempt_log.csv"  # Path to the attempt log CSV
 USE_TIMER_DEFAULT = 'y'
 
 # If True, creates a backup of ATTEMPT_LOG_CSV each time an attempt is logged or edited.
+# Backups are kept in a deduplicated, compressed store (ATTEMPT_LOG_CSV + ".backups"),
+# so each backup only stores the parts of the log that changed.
 ENABLE_BACKUP = True
 
-# If > 0, restricts the number of backup files to this many. Excess backups are deleted.
-# Example: If 5 backups already exist, creating a 6th backup removes the oldest one.
-MAX_BACKUPS = 5
+# If > 0, restricts the number of backups to this many. Excess backups are deleted.
+# Example: If 200 backups already exist, creating a 201st backup removes the oldest one.
+MAX_BACKUPS = 200
+
+# Average number of log lines per backup chunk. Smaller values share more data between
+# backups but compress less well.
+BACKUP_CHUNK_LINES = 32
 
 # If True, partial success is tracked. If a user does fewer reps than recommended for some sets
 # (but at least 1), the outcome can be "PARTIAL." Otherwise, any shortfall is treated as "INCOMPLETE."
 PARTIAL_SUCCESS_ENABLED = True
 
+# If True, keeps a sidecar file (ATTEMPT_LOG_CSV + ".sums") of per-block checksums for the log.
+# The sidecar is updated whenever the log is written, and the log is verified at startup.
+ENABLE_LOG_CHECKSUMS = True
+
+# Size in bytes of each checksummed block of the attempt log.
+CHECKSUM_BLOCK_SIZE = 4096
+
+# Attempt logs of at least this many bytes are parsed by several processes in parallel.
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Number of worker processes used for parallel parsing. None uses one per CPU core.
+PARALLEL_PARSE_WORKERS = None
+
+# If True, logged attempts are written (and backed up) by a background thread, so control
+# returns right away. Until they are written they are kept in memory, so the progress chart
+# and next-session preview already include them. Pending writes are always finished before
+# the log is edited, restored or re-scored, and on exit.
+ENABLE_BACKGROUND_WRITER = True
+
+# Maximum number of pending background writes. When full, new writes wait for a free slot.
+BACKGROUND_QUEUE_SIZE = 16
+
+# If set to a file path, every answer typed at a prompt is appended to that file, one per line.
+# The file can be replayed later with: python 100_pushups_simple.py --replay <file>
+RECORD_TRANSCRIPT = None
+
+# Columns of the attempt log, in order. sets_recommended was added later; older logs are
+# upgraded to it by upgrade_log_header() the next time an attempt is logged.
+LOG_FIELDS = ["timestamp", "week", "day", "column", "outcome", "sets_completed", "sets_recommended"]
+
+# State of the background writer thread (see start_background_writer())
+write_queue = None
+writer_thread = None
+
+# Rows queued by queue_log_row() that are not in the log yet. log_lock is held while rows are
+# appended to the log and while get_attempts() reads it, so a row is always seen exactly once.
+pending_rows = []
+log_lock = threading.Lock()
+
+# Messages from the background writer that have not been shown yet, see notify()
+writer_messages = []
+
+# Attempts of the last parsed log as (path, size, mtime_ns, attempts), see get_attempts()
+attempts_cache = None
+
+# Worker processes of load_attempt_logs_parallel() as (workers, pool), see get_parse_pool()
+parse_pool = None
+
+
+class ConsoleIO:
+    """
+    All user interaction of the tracker goes through the IO object below: prompts, output,
+    the clock used by the rest timer and log timestamps, and showing the progress chart.
+    ConsoleIO uses the terminal and the real clock; ReplayIO swaps in a scripted user.
+    """
+
+    def input(self, prompt=""):
+        answer = input(prompt)
+        if RECORD_TRANSCRIPT:
+            with open(RECORD_TRANSCRIPT, "a", encoding="utf-8") as f:
+                f.write(answer + "\n")
+        return answer
+
+    def print(self, *args, **kwargs):
+        print(*args, **kwargs)
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def time(self):
+        return time.time()
+
+    def now(self):
+        return datetime.now()
+
+    def show_chart(self):
+        plt.show()
+
+
+IO = ConsoleIO()
+
+
+def backup_store_path():
+    """
+    Returns the directory of the backup store for ATTEMPT_LOG_CSV. It contains two files:
+      chunks.pack    compressed pieces of the log, appended one record after another
+      manifests.txt  one line per backup, listing the chunks that make up that version
+    """
+    return f"{ATTEMPT_LOG_CSV}.backups"
+
+
+# Header of each record in chunks.pack: chunk id, id of the base chunk it was compressed
+# against (0 if none), first 16 bytes of the SHA-256 of the chunk, chunk length, and length
+# of the compressed data that follows the header.
+CHUNK_HEADER = struct.Struct(">II16sII")
+
+# Longest chain of chunks compressed against each other. Longer chains start over from a
+# chunk compressed on its own, which keeps restores fast.
+MAX_DELTA_CHAIN = 16
+
+
+def split_into_chunks(data):
+    """
+    Splits log contents into chunks at line boundaries. A chunk ends after a line whose CRC32
+    is divisible by BACKUP_CHUNK_LINES (or once it reaches 64 KiB), so chunk boundaries only
+    depend on the lines themselves. Appending, editing or removing a row therefore only
+    changes the chunks around it, and every other chunk is shared with earlier backups.
+    """
+    max_chunk_bytes = 64 * 1024
+    chunks = []
+    start = 0
+    pos = 0
+    while pos < len(data):
+        newline = data.find(b"\n", pos)
+        end = len(data) if newline == -1 else newline + 1
+        line = data[pos:end]
+        pos = end
+        if zlib.crc32(line) % BACKUP_CHUNK_LINES == 0 or pos - start >= max_chunk_bytes:
+            chunks.append(data[start:pos])
+            start = pos
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+def chunk_digest(chunk):
+    """
+    Returns the digest used to identify a chunk in the backup store.
+    """
+    return hashlib.sha256(chunk).digest()[:16]
+
+
+def read_chunk_index():
+    """
+    Scans chunks.pack and returns (index, valid_end). index maps each chunk id to
+    (base_id, digest, length, data_offset, compressed_length). valid_end is the offset
+    after the last complete record; anything after it is left over from an interrupted write.
+    """
+    index = {}
+    pack_path = os.path.join(backup_store_path(), "chunks.pack")
+    if not os.path.isfile(pack_path):
+        return index, 0
+    size = os.path.getsize(pack_path)
+    offset = 0
+    with open(pack_path, "rb") as f:
+        while offset + CHUNK_HEADER.size <= size:
+            f.seek(offset)
+            chunk_id, base_id, digest, length, compressed_length = CHUNK_HEADER.unpack(
+                f.read(CHUNK_HEADER.size))
+            data_offset = offset + CHUNK_HEADER.size
+            if data_offset + compressed_length > size:
+                break
+            index[chunk_id] = (base_id, digest, length, data_offset, compressed_length)
+            offset = data_offset + compressed_length
+    return index, offset
+
+
+def read_chunk(pack_file, index, chunk_id, chunk_cache):
+    """
+    Returns the contents of a chunk, decompressing its base chunks first if needed.
+    Decompressed chunks are kept in chunk_cache (a dictionary keyed by chunk id).
+    Raises ValueError if the chunk is missing or does not match its digest.
+    """
+    if chunk_id in chunk_cache:
+        return chunk_cache[chunk_id]
+    if chunk_id not in index:
+        raise ValueError(f"chunk {chunk_id} is missing")
+    base_id, digest, length, data_offset, compressed_length = index[chunk_id]
+    pack_file.seek(data_offset)
+    compressed = pack_file.read(compressed_length)
+    try:
+        if base_id:
+            base = read_chunk(pack_file, index, base_id, chunk_cache)
+            decompressor = zlib.decompressobj(zdict=base)
+        else:
+            decompressor = zlib.decompressobj()
+        chunk = decompressor.decompress(compressed) + decompressor.flush()
+    except zlib.error:
+        raise ValueError(f"chunk {chunk_id} is unreadable")
+    if len(chunk) != length or chunk_digest(chunk) != digest:
+        raise ValueError(f"chunk {chunk_id} is corrupt")
+    chunk_cache[chunk_id] = chunk
+    return chunk
+
+
+def read_manifests():
+    """
+    Returns every backup in the store as a list of (backup_name, chunk_ids), oldest first.
+    Each line of manifests.txt reads "<name> <kept> <id> <id> ...": the backup consists of
+    the first <kept> chunks of the previous backup followed by the listed chunk ids.
+    Raises ValueError if a line cannot be parsed. A last line without a newline is left
+    over from an interrupted write and is ignored.
+    """
+    manifest_path = os.path.join(backup_store_path(), "manifests.txt")
+    if not os.path.isfile(manifest_path):
+        return []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")[:-1]
+
+    manifests = []
+    previous = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2 or int(parts[1]) > len(previous):
+            raise ValueError(f"invalid manifest line: {line!r}")
+        chunk_ids = previous[:int(parts[1])] + [int(x) for x in parts[2:]]
+        manifests.append((parts[0], chunk_ids))
+        previous = chunk_ids
+    return manifests
+
+
+def manifest_line(backup_name, chunk_ids, previous_ids):
+    """
+    Returns the manifests.txt line for a backup, stored relative to the previous backup.
+    """
+    kept = 0
+    while kept < min(len(chunk_ids), len(previous_ids)) and chunk_ids[kept] == previous_ids[kept]:
+        kept += 1
+    return " ".join([backup_name, str(kept)] + [str(x) for x in chunk_ids[kept:]]) + "\n"
+
+
+def write_manifests(manifests):
+    """
+    Rewrites manifests.txt from a list of (backup_name, chunk_ids).
+    """
+    manifest_path = os.path.join(backup_store_path(), "manifests.txt")
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        previous = []
+        for backup_name, chunk_ids in manifests:
+            f.write(manifest_line(backup_name, chunk_ids, previous))
+            previous = chunk_ids
+    os.replace(tmp_path, manifest_path)
+
+
+def list_backups():
+    """
+    Returns the names of all backups in the store, oldest first.
+    Backup names are timestamps such as "20250124_120000_000000".
+    """
+    try:
+        return [backup_name for backup_name, _ in read_manifests()]
+    except (OSError, ValueError):
+        return []
+
+
+def read_backup(backup_name, chunk_cache=None):
+    """
+    Rebuilds the contents of a backup from its chunks and returns them as bytes.
+    Raises ValueError if the backup does not exist or a chunk is missing or corrupt.
+    chunk_cache is an optional dictionary of already decompressed chunks, shared between calls.
+    """
+    if chunk_cache is None:
+        chunk_cache = {}
+    chunk_ids = dict(read_manifests()).get(backup_name)
+    if chunk_ids is None:
+        raise ValueError(f"backup {backup_name} does not exist")
+    index, _ = read_chunk_index()
+    if not chunk_ids:
+        return b""
+    with open(os.path.join(backup_store_path(), "chunks.pack"), "rb") as pack_file:
+        return b"".join(read_chunk(pack_file, index, chunk_id, chunk_cache) for chunk_id in chunk_ids)
+
+
+def store_backup(data, backup_name):
+    """
+    Adds a version of the log to the backup store under backup_name.
+    Chunks already in the store are reused. A new chunk is compressed against the chunk at
+    the same position in the previous backup (usually an earlier version of the same rows),
+    so a chunk that only gained a row costs little more than that row.
+    Returns False (and stores nothing) if the newest backup already has identical contents.
+    """
+    store_dir = backup_store_path()
+    os.makedirs(store_dir, exist_ok=True)
+    pack_path = os.path.join(store_dir, "chunks.pack")
+
+    index, valid_end = read_chunk_index()
+    by_digest = {entry[1]: chunk_id for chunk_id, entry in index.items()}
+    manifests = read_manifests()
+    previous_ids = manifests[-1][1] if manifests else []
+    next_id = max(index, default=0) + 1
+
+    def chain_length(chunk_id):
+        length = 0
+        while chunk_id in index and index[chunk_id][0]:
+            chunk_id = index[chunk_id][0]
+            length += 1
+        return length
+
+    chunk_ids = []
+    records = []
+    chunk_cache = {}
+    with open(pack_path, "ab+") as pack_file:
+        for position, chunk in enumerate(split_into_chunks(data)):
+            digest = chunk_digest(chunk)
+            if digest in by_digest:
+                chunk_ids.append(by_digest[digest])
+                continue
 
-def backup_log_file():
+            base_id, base = 0, None
+            if position < len(previous_ids) and chain_length(previous_ids[position]) < MAX_DELTA_CHAIN:
+                try:
+                    base = read_chunk(pack_file, index, previous_ids[position], chunk_cache)
+                    base_id = previous_ids[position]
+                except ValueError:
+                    base = None
+            compressor = zlib.compressobj(9, zdict=base) if base else zlib.compressobj(9)
+            compressed = compressor.compress(chunk) + compressor.flush()
+
+            records.append(CHUNK_HEADER.pack(next_id, base_id, digest, len(chunk), len(compressed)))
+            records.append(compressed)
+            by_digest[digest] = next_id
+            chunk_ids.append(next_id)
+            next_id += 1
+
+        if chunk_ids == previous_ids:
+            return False
+        if records:
+            # Drop anything left over from an interrupted write before appending
+            pack_file.truncate(valid_end)
+            pack_file.write(b"".join(records))
+
+    manifest_path = os.path.join(store_dir, "manifests.txt")
+    with open(manifest_path, "ab+") as f:
+        f.seek(0)
+        contents = f.read()
+        if contents and not contents.endswith(b"\n"):
+            f.truncate(contents.rfind(b"\n") + 1)  # Drop an interrupted manifest line
+        f.write(manifest_line(backup_name, chunk_ids, previous_ids).encode("utf-8"))
+    return True
+
+
+def backup_log_file(quiet=False):
     """
-    Creates a timestamped backup copy of the ATTEMPT_LOG_CSV, if ENABLE_BACKUP is True.
+    Adds the current ATTEMPT_LOG_CSV to the backup store, if ENABLE_BACKUP is True.
+    Only chunks that are not yet in the store take up extra space, so a backup after
+    logging an attempt usually costs about as much as the new row.
     After creating the backup, calls prune_backups() if MAX_BACKUPS > 0.
+    If quiet is True, only errors are reported.
     """
     if not ENABLE_BACKUP:
         return
     if not os.path.isfile(ATTEMPT_LOG_CSV):
         return
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_filename = f"{ATTEMPT_LOG_CSV}.{timestamp}.bak"
+    backup_name = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     try:
-        with open(ATTEMPT_LOG_CSV, "rb") as src, open(backup_filename, "wb") as dst:
-            dst.write(src.read())
-        print(f"Backup created: {backup_filename}")
+        with open(ATTEMPT_LOG_CSV, "rb") as src:
+            data = src.read()
+        if not store_backup(data, backup_name):
+            return  # Nothing changed since the last backup
+        if not quiet:
+            IO.print(f"Backup created: {backup_name}")
     except Exception as e:
-        print(f"Backup failed: {e}")
+        notify(f"Backup failed: {e}")
         return
 
     if MAX_BACKUPS > 0:
-        prune_backups()
+        prune_backups(quiet)
+
 
+def prune_backups(quiet=False):
+    """
+    Removes the oldest backups if the total number of backups exceeds MAX_BACKUPS.
+    Chunks that are no longer needed are removed from chunks.pack once they take up
+    at least half of it. If quiet is True, only errors are reported.
+    """
+    try:
+        manifests = read_manifests()
+    except (OSError, ValueError) as e:
+        notify(f"Cannot prune backups: {e}")
+        return
+    if len(manifests) <= MAX_BACKUPS:
+        return  # No pruning needed
+
+    excess_count = len(manifests) - MAX_BACKUPS
+    kept = manifests[excess_count:]
+    try:
+        write_manifests(kept)
+    except OSError as e:
+        notify(f"Failed to remove old backups: {e}")
+        return
+    if not quiet:
+        for old_backup, _ in manifests[:excess_count]:
+            IO.print(f"Removed old backup: {old_backup}")
+
+    compact_chunk_pack(kept)
+
+
+def compact_chunk_pack(manifests):
+    """
+    Rewrites chunks.pack without the chunks that none of the given backups need, if those
+    chunks take up at least half of the file. Chunk ids do not change.
+    """
+    index, valid_end = read_chunk_index()
+    needed = set()
+    for _, chunk_ids in manifests:
+        for chunk_id in chunk_ids:
+            # Keep the base chunks a chunk was compressed against, too
+            while chunk_id and chunk_id not in needed:
+                needed.add(chunk_id)
+                chunk_id = index.get(chunk_id, (0,))[0]
+
+    unused_bytes = sum(CHUNK_HEADER.size + entry[4] for chunk_id, entry in index.items()
+                       if chunk_id not in needed)
+    if unused_bytes * 2 < valid_end:
+        return
 
-def prune_backups():
+    pack_path = os.path.join(backup_store_path(), "chunks.pack")
+    tmp_path = f"{pack_path}.tmp"
+    try:
+        with open(pack_path, "rb") as src, open(tmp_path, "wb") as dst:
+            for chunk_id in sorted(needed):
+                if chunk_id not in index:
+                    continue
+                base_id, digest, length, data_offset, compressed_length = index[chunk_id]
+                src.seek(data_offset)
+                dst.write(CHUNK_HEADER.pack(chunk_id, base_id, digest, length, compressed_length))
+                dst.write(src.read(compressed_length))
+        os.replace(tmp_path, pack_path)
+    except OSError as e:
+        notify(f"Failed to compact the backup store: {e}")
+
+
+def import_legacy_backups():
     """
-    Removes older backups if the total number of backups exceeds MAX_BACKUPS.
-    Gathers all files matching ATTEMPT_LOG_CSV.*.bak, sorts them by creation time,
-    and keeps only the most recent MAX_BACKUPS.
+    Moves full-copy backups from older versions of this script (files named
+    ATTEMPT_LOG_CSV.<YYYYmmdd_HHMMSS_ffffff>.bak, or ATTEMPT_LOG_CSV.<YYYYmmdd_HHMMSS>.bak
+    by the oldest versions) into the backup store.
     """
-    # Example backup filenames might look like:
-    #   "100_pushups_attempt_log.csv.20250124_120000.bak"
-    #   "100_pushups_attempt_log.csv.20250124_120100.bak"
-    # This function finds them all, sorts by creation time, and removes the oldest ones.
     pattern_prefix = f"{ATTEMPT_LOG_CSV}."
     pattern_suffix = ".bak"
+    legacy_files = [f for f in os.listdir(".")
+                    if f.startswith(pattern_prefix) and f.endswith(pattern_suffix)]
+    for legacy in sorted(legacy_files):
+        backup_name = legacy[len(pattern_prefix):-len(pattern_suffix)]
+        if len(backup_name) == len("YYYYmmdd_HHMMSS"):
+            backup_name += "_000000"
+        try:
+            datetime.strptime(backup_name, "%Y%m%d_%H%M%S_%f")
+        except ValueError:
+            continue  # Not a backup created by this script
+        try:
+            with open(legacy, "rb") as f:
+                store_backup(f.read(), backup_name)
+            os.remove(legacy)
+            IO.print(f"Imported old backup: {legacy}")
+        except Exception as e:
+            IO.print(f"Failed to import {legacy}: {e}")
 
-    # Gather all backups that start with "ATTEMPT_LOG_CSV." and end with ".bak"
-    # Use a simple approach: check if a file matches these prefix/suffix conditions.
-    all_files = os.listdir(".")
-    backup_files = []
-    for f in all_files:
-        if f.startswith(pattern_prefix) and f.endswith(pattern_suffix):
-            # Attempt to parse out the middle part for time sorting
-            backup_files.append(f)
 
-    if len(backup_files) <= MAX_BACKUPS:
-        return  # No pruning needed
+def iter_backup_contents():
+    """
+    Yields (backup_name, contents_bytes) for every backup of ATTEMPT_LOG_CSV,
+    newest first. Backups that cannot be rebuilt are skipped.
+    """
+    chunk_cache = {}
+    for backup in reversed(list_backups()):
+        try:
+            yield backup, read_backup(backup, chunk_cache)
+        except (OSError, ValueError):
+            continue
 
-    # Sort by creation or modification time (oldest first).
-    # On Windows, os.path.getmtime will be used. On other systems, same approach.
-    backup_files.sort(key=lambda x: os.path.getmtime(x))
 
-    # Remove old ones, keep only the newest MAX_BACKUPS
-    excess_count = len(backup_files) - MAX_BACKUPS
-    to_remove = backup_files[:excess_count]
-    for old_backup in to_remove:
+def restore_backup(backup_name):
+    """
+    Replaces ATTEMPT_LOG_CSV with the contents of the given backup.
+    The current log is backed up first, so a restore can itself be undone.
+    Returns True on success.
+    """
+    flush_background_writes()
+    try:
+        data = read_backup(backup_name)
+    except (OSError, ValueError) as e:
+        IO.print(f"Backup {backup_name} cannot be restored: {e}")
+        return False
+
+    backup_log_file()  # Backup before overwriting
+    try:
+        with open(ATTEMPT_LOG_CSV, "wb") as f:
+            f.write(data)
+        forget_cached_attempts()
+    except OSError as e:
+        IO.print(f"Restore failed: {e}")
+        return False
+    update_log_checksums(full_rebuild=True)
+    backup_log_file()
+    IO.print(f"Log restored from backup {backup_name}.")
+    return True
+
+
+def restore_log():
+    """
+    Lists all backups with their size and number of logged attempts,
+    and restores the one the user selects.
+    """
+    flush_background_writes()  # The writer may still be adding a backup
+    backups = list_backups()
+    if not backups:
+        IO.print("No backups available.")
+        return
+
+    IO.print("\n--- Restore Attempt Log ---")
+    chunk_cache = {}
+    for idx, backup in enumerate(backups):
         try:
-            os.remove(old_backup)
-            print(f"Removed old backup: {old_backup}")
-        except Exception as e:
-            print(f"Failed to remove {old_backup}: {e}")
+            data = read_backup(backup, chunk_cache)
+            rows = max(data.count(b"\n") - 1, 0)  # Header line is not an attempt
+            details = f"{len(data)} bytes, {rows} attempt(s)"
+        except (OSError, ValueError):
+            details = "damaged"
+        try:
+            created = datetime.strptime(backup, "%Y%m%d_%H%M%S_%f").strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            created = backup  # Not a timestamp, show the name as it is
+        IO.print(f"{idx}: {created} | {details}")
+
+    selection = IO.input("\nEnter the index of the backup to restore (or 'cancel' to exit): ").strip().lower()
+    if selection == "cancel":
+        IO.print("Restore canceled.")
+        return
+    try:
+        choice_idx = int(selection)
+        if choice_idx < 0 or choice_idx >= len(backups):
+            IO.print("Invalid index.")
+            return
+    except ValueError:
+        IO.print("Invalid selection.")
+        return
+
+    restore_backup(backups[choice_idx])
+
+
+def checksum_file_path():
+    """
+    Returns the path of the checksum sidecar file for ATTEMPT_LOG_CSV.
+    """
+    return f"{ATTEMPT_LOG_CSV}.sums"
+
+
+def load_log_checksums():
+    """
+    Loads the checksum sidecar as a dictionary with the keys:
+      block_size, length, verified_offset, blocks (list of SHA-256 hex digests).
+    Returns None if the sidecar is missing, unreadable, or uses a different block size.
+    """
+    path = checksum_file_path()
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            sums = json.load(f)
+        if sums["block_size"] != CHECKSUM_BLOCK_SIZE:
+            return None
+        if not isinstance(sums["length"], int) or not isinstance(sums["verified_offset"], int):
+            return None
+        if not isinstance(sums["blocks"], list):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return sums
+
+
+def save_log_checksums(sums):
+    """
+    Writes the checksum sidecar. A temporary file is written first and then moved into
+    place, so an interrupted write never leaves a half-written sidecar behind.
+    """
+    path = checksum_file_path()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(sums, f)
+    os.replace(tmp_path, path)
+
+
+def hash_blocks(data_file, start_block, end_offset):
+    """
+    Reads data_file from block number start_block up to end_offset (exclusive) and returns
+    a list with the SHA-256 hex digest of each CHECKSUM_BLOCK_SIZE block. The last block
+    may be shorter than CHECKSUM_BLOCK_SIZE.
+    """
+    digests = []
+    offset = start_block * CHECKSUM_BLOCK_SIZE
+    data_file.seek(offset)
+    while offset < end_offset:
+        block = data_file.read(min(CHECKSUM_BLOCK_SIZE, end_offset - offset))
+        if not block:
+            break
+        digests.append(hashlib.sha256(block).hexdigest())
+        offset += len(block)
+    return digests
+
+
+def update_log_checksums(full_rebuild=False):
+    """
+    Brings the checksum sidecar up to date with ATTEMPT_LOG_CSV, if ENABLE_LOG_CHECKSUMS is True.
+    Because the log is only appended to, just the last (partial) block and any new blocks are
+    hashed. Use full_rebuild=True after the log has been rewritten (e.g. by edit_log()).
+    The sidecar is left unchanged if the log is shorter than recorded or its last recorded
+    block no longer matches, so verify_log_integrity() still reports the damage.
+    """
+    if not ENABLE_LOG_CHECKSUMS:
+        return
+    if not os.path.isfile(ATTEMPT_LOG_CSV):
+        return
+
+    size = os.path.getsize(ATTEMPT_LOG_CSV)
+    sums = None if full_rebuild else load_log_checksums()
+    try:
+        with open(ATTEMPT_LOG_CSV, "rb") as f:
+            if sums is None:
+                start_block = 0
+                blocks = []
+                verified_offset = 0
+            else:
+                length = sums["length"]
+                if size < length:
+                    notify(f"Checksums not updated: {ATTEMPT_LOG_CSV} is shorter than expected.")
+                    return
+                # The last recorded block may have been partial; re-hash it along with the new
+                # data, but only if the part that was already checksummed is unchanged.
+                start_block = length // CHECKSUM_BLOCK_SIZE
+                if length % CHECKSUM_BLOCK_SIZE:
+                    if hash_blocks(f, start_block, length) != sums["blocks"][start_block:]:
+                        notify(f"Checksums not updated: the end of {ATTEMPT_LOG_CSV} has changed.")
+                        return
+                blocks = sums["blocks"][:start_block]
+                verified_offset = min(sums["verified_offset"], start_block * CHECKSUM_BLOCK_SIZE)
+            blocks += hash_blocks(f, start_block, size)
+        save_log_checksums({
+            "block_size": CHECKSUM_BLOCK_SIZE,
+            "length": size,
+            "verified_offset": verified_offset,
+            "blocks": blocks
+        })
+    except OSError as e:
+        notify(f"Checksum update failed: {e}")
+
+
+def read_log_tail(data_file, length):
+    """
+    Reads what follows the first length bytes (the checksummed part) of a log file.
+    Returns (header_line, previous_byte, tail): header_line is empty if the header itself is
+    part of the tail, and previous_byte is the last checksummed byte (empty if length is 0).
+    """
+    data_file.seek(0)
+    header_line = data_file.readline()
+    if len(header_line) > length:
+        header_line = b""
+    previous_byte = b""
+    if length > 0:
+        data_file.seek(length - 1)
+        previous_byte = data_file.read(1)
+    data_file.seek(length)
+    return header_line, previous_byte, data_file.read()
+
+
+def log_tail_is_valid(header_line, previous_byte, tail):
+    """
+    Returns True if the bytes after the checksummed part of the log are complete rows: they
+    start and end on a line boundary and every row parses the way get_attempts() parses it.
+    A row that was only partly written (e.g. the program crashed during an append) fails this.
+    """
+    if not tail.endswith(b"\n") or previous_byte not in (b"", b"\n"):
+        return False
+    if not header_line:
+        header_line, _, tail = tail.partition(b"\n")
+    try:
+        fieldnames = next(csv.reader([header_line.decode("utf-8")]))
+        for row in csv.DictReader(io.StringIO(tail.decode("utf-8"), newline=""), fieldnames=fieldnames):
+            int(row["week"])
+            int(row["day"])
+            row["sets_completed"].split("|")
+            if row["timestamp"] is None or row["column"] is None or row["outcome"] is None:
+                return False
+    except (UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError, StopIteration, csv.Error):
+        return False
+    return True
+
+
+def find_unparsable_rows(data):
+    """
+    Returns the (start, end) byte ranges of the rows in the given log contents that
+    get_attempts() cannot parse (see log_tail_is_valid()), including an incomplete last row.
+    """
+    header_line, _, rows = data.partition(b"\n")
+    damaged = []
+    offset = len(header_line) + 1
+    lines = rows.split(b"\n")
+    for i, line in enumerate(lines):
+        if i < len(lines) - 1:
+            line += b"\n"
+        if line and not log_tail_is_valid(header_line, b"\n", line):
+            if damaged and damaged[-1][1] == offset:
+                damaged[-1] = (damaged[-1][0], offset + len(line))
+            else:
+                damaged.append((offset, offset + len(line)))
+        offset += len(line)
+    return damaged
+
+
+def verify_log_integrity(full=False):
+    """
+    Verifies ATTEMPT_LOG_CSV against its checksum sidecar and returns a list of damaged
+    (start, end) byte ranges. An empty list means the log is intact.
+    Only blocks at or after the last verified offset (and always the last recorded block)
+    are hashed, unless full=True. A log shorter than recorded is always reported as damaged.
+    Complete rows appended after the sidecar was last updated are adopted if everything else
+    is intact; anything else after the recorded length is reported as damaged.
+    If no sidecar exists yet, every row is checked with find_unparsable_rows() instead, and
+    the sidecar is only created if they all parse.
+    """
+    if not ENABLE_LOG_CHECKSUMS:
+        return []
+    sums = load_log_checksums()
+    if sums is None:
+        if os.path.isfile(ATTEMPT_LOG_CSV):
+            with open(ATTEMPT_LOG_CSV, "rb") as f:
+                damaged = find_unparsable_rows(f.read())
+            if damaged:
+                return damaged
+        update_log_checksums(full_rebuild=True)
+        return []
+
+    length = sums["length"]
+    size = os.path.getsize(ATTEMPT_LOG_CSV) if os.path.isfile(ATTEMPT_LOG_CSV) else 0
+    start_block = 0
+    if not full:
+        last_block = max(len(sums["blocks"]) - 1, 0)
+        start_block = min(sums["verified_offset"] // CHECKSUM_BLOCK_SIZE, last_block,
+                          size // CHECKSUM_BLOCK_SIZE)
+
+    actual_blocks = []
+    if size > 0:
+        with open(ATTEMPT_LOG_CSV, "rb") as f:
+            actual_blocks = hash_blocks(f, start_block, min(size, length))
+
+    damaged = []
+    for i, expected in enumerate(sums["blocks"][start_block:]):
+        block_start = (start_block + i) * CHECKSUM_BLOCK_SIZE
+        block_end = min(block_start + CHECKSUM_BLOCK_SIZE, length)
+        if block_end > size or actual_blocks[i] != expected:
+            if damaged and damaged[-1][1] == block_start:
+                damaged[-1] = (damaged[-1][0], block_end)
+            else:
+                damaged.append((block_start, block_end))
+    if size < length and not damaged:
+        damaged.append((size, length))  # The sidecar has no blocks, but data is missing
+
+    if damaged:
+        return damaged
+
+    if size > length:
+        with open(ATTEMPT_LOG_CSV, "rb") as f:
+            tail_valid = log_tail_is_valid(*read_log_tail(f, length))
+        if not tail_valid:
+            return [(length, size)]
+        IO.print(f"Note: {size - length} byte(s) at the end of {ATTEMPT_LOG_CSV} had no checksum yet; "
+                 "they have been added.")
+        update_log_checksums()
+        sums = load_log_checksums()
+    if sums is not None:
+        sums["verified_offset"] = sums["length"]
+        save_log_checksums(sums)
+    return []
+
+
+def repair_log_from_backups():
+    """
+    Restores the damaged blocks of ATTEMPT_LOG_CSV from backups. Each damaged block is taken
+    from the newest backup whose bytes at that position match the recorded checksum.
+    Bytes after the checksummed part of the log are kept only if they are complete rows
+    (see log_tail_is_valid()); an incomplete row is dropped.
+    The damaged log is kept as ATTEMPT_LOG_CSV.<timestamp>.damaged before it is overwritten.
+    Returns True if the log was fully repaired, otherwise False (the log is left untouched).
+    """
+    sums = load_log_checksums()
+    if sums is None:
+        IO.print("No checksums available; the log cannot be repaired.")
+        return False
+
+    length = sums["length"]
+    current = b""
+    if os.path.isfile(ATTEMPT_LOG_CSV):
+        with open(ATTEMPT_LOG_CSV, "rb") as f:
+            current = f.read()
+
+    # Find every damaged block by checking all of them, not just the unverified tail
+    missing = {}
+    for i, expected in enumerate(sums["blocks"]):
+        block_start = i * CHECKSUM_BLOCK_SIZE
+        block_end = min(block_start + CHECKSUM_BLOCK_SIZE, length)
+        block = current[block_start:block_end]
+        if len(block) != block_end - block_start or hashlib.sha256(block).hexdigest() != expected:
+            missing[i] = (block_start, block_end, expected)
+    tail = current[length:]
+
+    repaired = bytearray(current[:length].ljust(length, b"\0"))
+    for backup_name, data in iter_backup_contents():
+        if not missing:
+            break
+        for i, (block_start, block_end, expected) in list(missing.items()):
+            block = data[block_start:block_end]
+            if len(block) == block_end - block_start and hashlib.sha256(block).hexdigest() == expected:
+                repaired[block_start:block_end] = block
+                del missing[i]
+                IO.print(f"Restored bytes {block_start}-{block_end} from {backup_name}")
+
+    if missing:
+        for block_start, block_end, _ in sorted(missing.values()):
+            IO.print(f"No backup contains a matching copy of bytes {block_start}-{block_end}.")
+        IO.print("Log was not repaired.")
+        return False
+
+    keep_tail = log_tail_is_valid(*read_log_tail(io.BytesIO(bytes(repaired) + tail), length))
+    if not tail or keep_tail:
+        if bytes(repaired) == current[:length]:
+            IO.print("No damaged blocks were found.")
+            return True
+    else:
+        IO.print(f"Dropping {len(tail)} byte(s) of incomplete rows at the end of the log.")
+        tail = b""
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    damaged_filename = f"{ATTEMPT_LOG_CSV}.{timestamp}.damaged"
+    try:
+        with open(damaged_filename, "wb") as f:
+            f.write(current)
+        with open(ATTEMPT_LOG_CSV, "wb") as f:
+            f.write(bytes(repaired) + tail)
+        forget_cached_attempts()
+    except OSError as e:
+        IO.print(f"Repair failed: {e}")
+        return False
+
+    IO.print(f"Log repaired. The damaged copy was saved as {damaged_filename}")
+    verify_log_integrity()
+    return True
+
+
+def check_log_integrity_at_startup():
+    """
+    Verifies the attempt log on startup and, if damage is found, offers to repair it
+    from the backups. Also makes sure every row of the log can be read.
+    Returns True if the log can be used, or False (after explaining why) if it is still
+    damaged, in which case the tracker must not continue.
+    """
+    damaged = verify_log_integrity()
+    if damaged:
+        IO.print(f"WARNING: {ATTEMPT_LOG_CSV} appears to be corrupt or truncated.")
+        for start, end in damaged:
+            IO.print(f"  Damaged bytes: {start}-{end}")
+        answer = IO.input("Attempt to repair the log from backups? (y/n): ").strip().lower()
+        if answer not in ["y", "yes"] or not repair_log_from_backups():
+            IO.print(f"\n{ATTEMPT_LOG_CSV} is still damaged, so the tracker cannot continue.")
+            IO.print("Repair or replace the damaged rows listed above, then start the tracker again.")
+            return False
+
+    try:
+        get_attempts()
+    except (ValueError, KeyError, TypeError, AttributeError, csv.Error) as e:
+        IO.print(f"ERROR: {ATTEMPT_LOG_CSV} cannot be read ({e}), so the tracker cannot continue.")
+        IO.print("Repair or replace the damaged rows, then start the tracker again.")
+        return False
+    return True
 
 
 def load_plan(csv_filename):
@@ -118,7 +948,7 @@ def load_plan(csv_filename):
     """
     plan_data = []
     if not os.path.exists(csv_filename):
-        print(f"ERROR: Plan file '{csv_filename}' not found.")
+        IO.print(f"ERROR: Plan file '{csv_filename}' not found.")
         return plan_data
 
     with open(csv_filename, 'r', newline='', encoding='utf-8') as f:
@@ -187,6 +1017,13 @@ def parse_set_minimum(set_str):
     return 0
 
 
+def get_planned_reps(plan_entry):
+    """
+    Returns the recommended reps of every set in a plan entry, using parse_set_minimum().
+    """
+    return [parse_set_minimum(set_str) for set_str in plan_entry['sets']]
+
+
 def rest_timer(rest_str):
     """
     Displays a rest timer that attempts to handle possible ranges or plus notation:
@@ -216,19 +1053,19 @@ def rest_timer(rest_str):
         if match:
             duration = int(match.group(1))
 
-    print(f"\nRest for {duration} second(s) (press Ctrl+C to skip).")
+    IO.print(f"\nRest for {duration} second(s) (press Ctrl+C to skip).")
 
     try:
-        end_time = time.time() + duration
+        end_time = IO.time() + duration
         while True:
-            remaining = int(end_time - time.time())
+            remaining = int(end_time - IO.time())
             if remaining <= 0:
                 break
-            print(f"\r{remaining} ", end="", flush=True)
-            time.sleep(1)
-        print("\nRest complete!\n")
+            IO.print(f"\r{remaining} ", end="", flush=True)
+            IO.sleep(1)
+        IO.print("\nRest complete!\n")
     except KeyboardInterrupt:
-        print("\nRest timer skipped!\n")
+        IO.print("\nRest timer skipped!\n")
 
 
 def do_session(plan_entry):
@@ -248,9 +1085,9 @@ def do_session(plan_entry):
     total_sets = len(sets_planned)
 
     w, d, c = plan_entry['week'], plan_entry['day'], plan_entry['column']
-    print(f"\n--- Session: Week {w}, Day {d}, Col {c} ---")
-    print(f"Rest: {rest_str}")
-    print("Planned sets:", ", ".join(sets_planned), "\n")
+    IO.print(f"\n--- Session: Week {w}, Day {d}, Col {c} ---")
+    IO.print(f"Rest: {rest_str}")
+    IO.print("Planned sets:", ", ".join(sets_planned), "\n")
 
     for i, set_str in enumerate(sets_planned, start=1):
         recommended = parse_set_minimum(set_str)
@@ -258,21 +1095,21 @@ def do_session(plan_entry):
 
         if final_set_with_max:
             # Prompt for how many were actually done in the final "MAX≥X" set
-            print(f"Final set: {set_str} pushups.")
+            IO.print(f"Final set: {set_str} pushups.")
             while True:
                 try:
-                    actual = int(input("How many pushups were completed in the final set? "))
+                    actual = int(IO.input("How many pushups were completed in the final set? "))
                     if actual < 0:
                         raise ValueError
                     set_data.append((actual, recommended))
                     break
                 except ValueError:
-                    print("Invalid input. Please enter a non-negative integer.")
+                    IO.print("Invalid input. Please enter a non-negative integer.")
         else:
-            print(f"Set {i}: {set_str} pushups.")
-            action = input("Press Enter to confirm completion or type 'quit' to stop: ").strip().lower()
+            IO.print(f"Set {i}: {set_str} pushups.")
+            action = IO.input("Press Enter to confirm completion or type 'quit' to stop: ").strip().lower()
             if action == 'quit':
-                print("Session was stopped before completion.")
+                IO.print("Session was stopped before completion.")
                 return set_data, False
             # Optionally, prompt for actual reps instead of assuming
             # For simplicity, we'll assume completion of the planned reps
@@ -281,10 +1118,10 @@ def do_session(plan_entry):
         if i < total_sets:
             # Show the next set's pushup count
             next_set_str = sets_planned[i]
-            print(f"Next set will be: {next_set_str} pushups.\n")
+            IO.print(f"Next set will be: {next_set_str} pushups.\n")
 
             # Ask whether to start the rest timer
-            use_timer = input(f"Start rest timer? (default={USE_TIMER_DEFAULT}): ").strip().lower()
+            use_timer = IO.input(f"Start rest timer? (default={USE_TIMER_DEFAULT}): ").strip().lower()
             if not use_timer:
                 use_timer = USE_TIMER_DEFAULT
             if use_timer in ["y", "yes"]:
@@ -324,73 +1161,574 @@ def determine_outcome(set_data, session_completed):
             return "INCOMPLETE"
 
 
-def log_attempt(week, day, column, set_data, outcome):
+def rescore_attempts(attempts, plan_data=None):
+    """
+    Recomputes the outcome of every attempt with the rules of determine_outcome(), in one
+    vectorized pass over the sets of all attempts. Returns a list with the new outcome of
+    each attempt, or None for attempts that cannot be re-scored (TEST attempts, and attempts
+    without recommended reps).
+    The recommended reps come from each attempt's sets_recommended, or from the matching
+    entry in plan_data if plan_data is given (e.g. after the plan CSV was corrected).
+    A session counts as completed if at least as many sets were done as recommended.
+    Uses NumPy if it is installed, otherwise the same computation in pure Python.
     """
-    Logs an attempt to the CSV file. If ENABLE_BACKUP is True, creates a backup first.
+    plan_reps = None
+    if plan_data is not None:
+        plan_reps = {(e['week'], e['day'], e['column']): get_planned_reps(e) for e in plan_data}
+
+    # Flatten the (actual, recommended) pairs of every scorable attempt into two arrays
+    scored_idx = []
+    pair_counts = array("q")
+    completed = []
+    actual_flat, recommended_flat = array("q"), array("q")
+    for idx, att in enumerate(attempts):
+        if att["outcome"] == "TEST":
+            continue
+        if plan_reps is not None:
+            recommended = plan_reps.get((att["week"], att["day"], att["column"]))
+        else:
+            recommended = att["sets_recommended"]
+        if not recommended:
+            continue
+        actual = att["sets_completed"]
+        num_pairs = min(len(actual), len(recommended))
+        scored_idx.append(idx)
+        pair_counts.append(num_pairs)
+        completed.append(len(actual) >= len(recommended))
+        actual_flat.extend(actual[:num_pairs])
+        recommended_flat.extend(recommended[:num_pairs])
+
+    if np is not None and scored_idx:
+        counts = np.asarray(pair_counts)
+        owner = np.repeat(np.arange(len(scored_idx)), counts)  # attempt number of each set
+        actual_arr = np.asarray(actual_flat)
+        short = actual_arr < np.asarray(recommended_flat)
+        short_sets = np.bincount(owner, weights=short, minlength=len(scored_idx))
+        partial_sets = np.bincount(owner, weights=short & (actual_arr > 0), minlength=len(scored_idx))
+        done = np.asarray(completed, dtype=bool) & (counts > 0)
+        partial = (partial_sets > 0) if PARTIAL_SUCCESS_ENABLED else np.zeros(len(scored_idx), dtype=bool)
+        scores = np.where(~done, "INCOMPLETE",
+                          np.where(short_sets == 0, "SUCCESS",
+                                   np.where(partial, "PARTIAL", "INCOMPLETE"))).tolist()
+    else:
+        scores = []
+        pos = 0
+        for num_pairs, session_completed in zip(pair_counts, completed):
+            set_data = list(zip(actual_flat[pos:pos + num_pairs], recommended_flat[pos:pos + num_pairs]))
+            scores.append(determine_outcome(set_data, session_completed))
+            pos += num_pairs
+
+    new_outcomes = [None] * len(attempts)
+    for idx, outcome in zip(scored_idx, scores):
+        new_outcomes[idx] = outcome
+    return new_outcomes
+
+
+def start_background_writer():
+    """
+    Starts the background writer thread (if it is not running yet), which performs the
+    queued log writes one at a time, in order. Pending writes are flushed when the
+    program exits.
+    """
+    global write_queue, writer_thread
+    if writer_thread is not None and writer_thread.is_alive():
+        return
+    write_queue = queue.Queue(maxsize=BACKGROUND_QUEUE_SIZE)
+    writer_thread = threading.Thread(target=background_writer_loop, args=(write_queue,),
+                                     name="log-writer", daemon=True)
+    writer_thread.start()
+    atexit.register(flush_background_writes)
+
+
+def background_writer_loop(pending):
+    """
+    Runs in the background writer thread: takes (function, args) pairs from the queue
+    and calls them. Errors are reported and do not stop the thread.
+    """
+    while True:
+        func, args = pending.get()
+        try:
+            func(*args)
+        except Exception as e:
+            notify(f"Background write failed: {e}")
+        finally:
+            pending.task_done()
+
+
+def run_in_background(func, *args):
+    """
+    Queues func(*args) for the background writer, if ENABLE_BACKGROUND_WRITER is True;
+    otherwise calls it right away. Blocks while the queue is full.
+    """
+    if not ENABLE_BACKGROUND_WRITER:
+        func(*args)
+        return
+    start_background_writer()
+    write_queue.put((func, args))
+
+
+def flush_background_writes():
+    """
+    Waits until every queued write has been performed. Called before the log is rewritten
+    or restored, and on exit.
+    """
+    if write_queue is not None and writer_thread is not None and writer_thread.is_alive():
+        write_queue.join()
+    print_writer_messages()
+
+
+def on_writer_thread():
+    """
+    Returns True if called from the background writer thread.
+    """
+    return writer_thread is not None and threading.current_thread() is writer_thread
+
+
+def notify(message):
+    """
+    Prints a message, unless it comes from the background writer thread: the main thread
+    may be in the middle of a prompt then, so the message is kept in writer_messages until
+    print_writer_messages() shows it.
+    """
+    if on_writer_thread():
+        writer_messages.append(message)
+    else:
+        IO.print(message)
+
+
+def print_writer_messages():
+    """
+    Prints the messages the background writer has collected so far (see notify()).
+    Called by the main thread where no prompt is open.
+    """
+    while writer_messages:
+        IO.print(writer_messages.pop(0))
+
+
+def upgrade_log_header():
+    """
+    Rewrites an attempt log that was created by an older version of this script
+    (without the sets_recommended column) with the current LOG_FIELDS header.
+    Missing columns are left empty for the existing rows.
+    """
+    if not os.path.isfile(ATTEMPT_LOG_CSV):
+        return
+    with open(ATTEMPT_LOG_CSV, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if header != LOG_FIELDS[:-1]:
+            return  # Already current, or not a header this script wrote
+        rows = list(reader)
+
+    with open(ATTEMPT_LOG_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(LOG_FIELDS)
+        for row in rows:
+            if not row:
+                continue
+            fields = dict(zip(header, row))
+            writer.writerow([fields.get(name, "") for name in LOG_FIELDS])
+    forget_cached_attempts()
+    update_log_checksums(full_rebuild=True)
+    notify(f"Upgraded {ATTEMPT_LOG_CSV} to the current log format.")
+
+
+def append_log_row(row):
+    """
+    Appends one row to the attempt log, writing the header first if the log is new, and
+    removes it from pending_rows if it was queued by queue_log_row().
+    Updates the log checksums afterwards. If ENABLE_BACKUP is True, the new state of the log
+    is then backed up, so repair_log_from_backups() always has a copy of the newest blocks.
+    """
+    with log_lock:
+        try:
+            upgrade_log_header()
+
+            file_exists = os.path.isfile(ATTEMPT_LOG_CSV)
+            with open(ATTEMPT_LOG_CSV, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                if not file_exists:
+                    writer.writerow(LOG_FIELDS)
+                writer.writerow(row)
+            forget_cached_attempts()
+        finally:
+            if row in pending_rows:
+                pending_rows.remove(row)
+    update_log_checksums()
+    # Only creates a backup if ENABLE_BACKUP is True. On the background writer, only errors
+    # are reported, so routine backup messages do not pile up between prompts.
+    backup_log_file(quiet=on_writer_thread())
+
+
+def write_all_attempts(attempts):
+    """
+    Rewrites the whole attempt log from a list of attempt dictionaries
+    (as returned by get_attempts()), rebuilds the log checksums and backs up the new state.
+    """
+    with open(ATTEMPT_LOG_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(LOG_FIELDS)
+        for att in attempts:
+            writer.writerow([
+                att["timestamp"],
+                att["week"],
+                att["day"],
+                att["column"],
+                att["outcome"],
+                "|".join(map(str, att["sets_completed"])),
+                "|".join(map(str, att["sets_recommended"]))
+            ])
+    forget_cached_attempts()
+    update_log_checksums(full_rebuild=True)
+    backup_log_file()
+
+
+def queue_log_row(row, message):
+    """
+    Appends a row to the attempt log on the background writer (see run_in_background()) and
+    reports message once the row has been written, or an error if writing failed (see notify()).
+    Until then the row is kept in pending_rows, so get_attempts() already includes it.
+    """
+    with log_lock:
+        pending_rows.append(row)
+    run_in_background(write_log_row, row, message)
+
+
+def write_log_row(row, message):
+    """
+    Runs on the background writer: appends a row queued by queue_log_row() to the log
+    and reports the result.
+    """
+    try:
+        append_log_row(row)
+    except Exception as e:
+        notify(f"\nFailed to log attempt {row}: {e}")
+        return
+    notify(message)
+
+
+def log_attempt(week, day, column, set_data, outcome, planned_reps):
+    """
+    Logs an attempt to the CSV file. If ENABLE_BACKUP is True, the updated log is backed up.
+    The write happens on the background writer (see queue_log_row()).
     The set_data parameter is a list of (actual, recommended) for each set.
     The outcome parameter is a string: "SUCCESS", "PARTIAL", or "INCOMPLETE".
+    The planned_reps parameter lists the recommended reps of every set in the plan entry,
+    including sets that were not reached if the session was stopped early. It is stored in
+    the sets_recommended column so the outcome can be re-evaluated later (see rescore_log()).
     """
-    backup_log_file()  # Only creates a backup if ENABLE_BACKUP is True
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    # Store only the actual reps in the CSV
+    timestamp = IO.now().strftime("%Y-%m-%d %H:%M:%S")
     actuals_only = [str(tup[0]) for tup in set_data]
     sets_str = "|".join(actuals_only)
+    recommended_str = "|".join(map(str, planned_reps))
 
-    file_exists = os.path.isfile(ATTEMPT_LOG_CSV)
-    with open(ATTEMPT_LOG_CSV, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["timestamp", "week", "day", "column", "outcome", "sets_completed"])
-        writer.writerow([timestamp, week, day, column, outcome, sets_str])
-
-    print(f"\nLogged attempt: {outcome} => {sets_str}")
+    queue_log_row([timestamp, week, day, column, outcome, sets_str, recommended_str],
+                  f"\nLogged attempt: {outcome} => {sets_str}")
 
 
 def log_test_attempt(num_pushups):
     """
     Logs a single-set max test attempt. This uses week=-1, day=-1, column="TEST", outcome="TEST".
-    Backup is created first if ENABLE_BACKUP is True.
+    The updated log is backed up if ENABLE_BACKUP is True.
+    The write happens on the background writer (see queue_log_row()).
     """
-    backup_log_file()  # Will only back up if ENABLE_BACKUP
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = IO.now().strftime("%Y-%m-%d %H:%M:%S")
     sets_str = str(num_pushups)
     outcome = "TEST"
 
-    file_exists = os.path.isfile(ATTEMPT_LOG_CSV)
-    with open(ATTEMPT_LOG_CSV, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["timestamp", "week", "day", "column", "outcome", "sets_completed"])
-        writer.writerow([timestamp, -1, -1, "TEST", outcome, sets_str])
-
-    print(f"\nLogged TEST attempt: single-set max = {num_pushups}")
+    queue_log_row([timestamp, -1, -1, "TEST", outcome, sets_str, ""],
+                  f"\nLogged TEST attempt: single-set max = {num_pushups}")
 
 
 def get_attempts():
     """
     Retrieves and parses all attempts from the attempt log, sorted by timestamp.
     Returns a list of dictionaries, each containing:
-      timestamp, week, day, column, outcome, sets_completed (as ints).
+      timestamp, week, day, column, outcome, sets_completed and sets_recommended (as ints).
+    sets_recommended is empty for TEST attempts and for attempts logged before it was stored.
+    Attempts that the background writer has not written yet are included, without waiting
+    for the write.
+    The parsed log is cached until it changes (see read_log_attempts()), so the dictionaries
+    are shared between calls: replace an attempt in the returned list instead of modifying it.
     """
-    if not os.path.isfile(ATTEMPT_LOG_CSV):
-        return []
-    with open(ATTEMPT_LOG_CSV, "r", newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-        attempts = []
-        for row in rows:
-            sets_list = [int(x) for x in row["sets_completed"].split("|") if x.isdigit()]
-            attempts.append({
-                "timestamp": row["timestamp"],
-                "week": int(row["week"]),
-                "day": int(row["day"]),
-                "column": row["column"],
-                "outcome": row["outcome"],
-                "sets_completed": sets_list
-            })
+    with log_lock:
+        attempts = read_log_attempts()
+        pending = list(pending_rows)
+    if pending:
+        attempts.extend(attempt_from_row(dict(zip(LOG_FIELDS, map(str, row)))) for row in pending)
         attempts.sort(key=lambda a: a["timestamp"])
-        return attempts
+    return attempts
+
+
+def read_log_attempts():
+    """
+    Parses the attempt log as described in get_attempts() and returns a new list of the
+    attempts in it. Logs of at least PARALLEL_PARSE_MIN_BYTES are parsed with
+    load_attempt_logs_parallel(), which gives the same result as parse_log_file().
+    The result is cached by the path, size and modification time of the log.
+    """
+    global attempts_cache
+    try:
+        stat = os.stat(ATTEMPT_LOG_CSV)
+    except FileNotFoundError:
+        return []
+    key = (ATTEMPT_LOG_CSV, stat.st_size, stat.st_mtime_ns)
+    if attempts_cache is not None and attempts_cache[:3] == key:
+        return list(attempts_cache[3])
+
+    if stat.st_size >= PARALLEL_PARSE_MIN_BYTES:
+        attempts = load_attempt_logs_parallel([ATTEMPT_LOG_CSV])[0]
+    else:
+        attempts = parse_log_file(ATTEMPT_LOG_CSV)
+    attempts_cache = key + (attempts,)
+    return list(attempts)
+
+
+def parse_log_file(path):
+    """
+    Parses a whole attempt log in this process and returns its attempts sorted by timestamp.
+    """
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        attempts = [attempt_from_row(row) for row in csv.DictReader(f)]
+    attempts.sort(key=lambda a: a["timestamp"])
+    return attempts
+
+
+def attempt_from_row(row):
+    """
+    Converts a row of the attempt log (a dictionary of strings, as read by csv.DictReader)
+    into an attempt dictionary as returned by get_attempts().
+    """
+    sets_list = [int(x) for x in row["sets_completed"].split("|") if x.isdigit()]
+    recommended_str = row.get("sets_recommended") or ""
+    recommended_list = [int(x) for x in recommended_str.split("|") if x.isdigit()]
+    return {
+        "timestamp": row["timestamp"],
+        "week": int(row["week"]),
+        "day": int(row["day"]),
+        "column": row["column"],
+        "outcome": row["outcome"],
+        "sets_completed": sets_list,
+        "sets_recommended": recommended_list
+    }
+
+
+def forget_cached_attempts():
+    """
+    Drops the attempts cached by get_attempts(). Called whenever this script writes the log,
+    so the next read never depends on the file system updating the modification time.
+    """
+    global attempts_cache
+    attempts_cache = None
+
+
+def split_log_ranges(path, num_ranges):
+    """
+    Reads the header of an attempt log and splits the rest of the file into at most
+    num_ranges byte ranges of roughly equal size. Every range starts at the beginning
+    of a line. Returns (fieldnames, [(start, end), ...]).
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        size = os.path.getsize(path)
+        fieldnames = next(csv.reader([header.decode("utf-8")]), [])
+
+        boundaries = [data_start]
+        step = max((size - data_start) // max(num_ranges, 1), 1)
+        for i in range(1, num_ranges):
+            target = data_start + i * step
+            if target <= boundaries[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()  # Move on to the start of the next line
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > boundaries[-1]:
+                boundaries.append(pos)
+        boundaries.append(size)
+
+    ranges = [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)
+              if boundaries[i] < boundaries[i + 1]]
+    return fieldnames, ranges
+
+
+def parse_log_range(path, fieldnames, start, end):
+    """
+    Parses the rows in bytes [start, end) of an attempt log. Runs in a worker process.
+    Rows are parsed exactly like get_attempts() does, sorted by timestamp, and returned
+    as compact columns instead of dictionaries, which are much cheaper to send back:
+      (timestamps, weeks, days, columns, outcomes, set_counts, set_values,
+       recommended_counts, recommended_values)
+    set_counts holds the number of sets of each row; set_values holds all sets back to back.
+    recommended_counts and recommended_values hold sets_recommended the same way.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    # Look fields up by position instead of building a dictionary per row. Like csv.DictReader,
+    # blank lines are skipped, missing fields read as None and duplicate names use the last column.
+    index = {name: i for i, name in enumerate(fieldnames)}
+    ts_idx, week_idx, day_idx = index["timestamp"], index["week"], index["day"]
+    col_idx, outcome_idx, sets_idx = index["column"], index["outcome"], index["sets_completed"]
+    recommended_idx = index.get("sets_recommended")
+    padding = [None] * len(fieldnames)
+
+    timestamps, columns, outcomes = [], [], []
+    weeks, days = array("q"), array("q")
+    sets_per_row, recommended_per_row = [], []
+    for row in csv.reader(io.StringIO(text, newline="")):
+        if not row:
+            continue
+        if len(row) < len(fieldnames):
+            row = row + padding[len(row):]
+        sets_per_row.append([int(x) for x in row[sets_idx].split("|") if x.isdigit()])
+        recommended_str = (row[recommended_idx] if recommended_idx is not None else None) or ""
+        recommended_per_row.append([int(x) for x in recommended_str.split("|") if x.isdigit()])
+        timestamps.append(row[ts_idx])
+        weeks.append(int(row[week_idx]))
+        days.append(int(row[day_idx]))
+        columns.append(row[col_idx])
+        outcomes.append(row[outcome_idx])
+
+    order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    set_counts, set_values = array("q"), array("q")
+    recommended_counts, recommended_values = array("q"), array("q")
+    for i in order:
+        set_counts.append(len(sets_per_row[i]))
+        set_values.extend(sets_per_row[i])
+        recommended_counts.append(len(recommended_per_row[i]))
+        recommended_values.extend(recommended_per_row[i])
+    return ([timestamps[i] for i in order],
+            array("q", (weeks[i] for i in order)),
+            array("q", (days[i] for i in order)),
+            [columns[i] for i in order],
+            [outcomes[i] for i in order],
+            set_counts,
+            set_values,
+            recommended_counts,
+            recommended_values)
+
+
+def merge_parsed_ranges(parsed_ranges):
+    """
+    Merges the compact columns returned by parse_log_range() for the ranges of one log
+    (in file order) into a list of attempt dictionaries sorted by timestamp.
+    Each range is already sorted, so the stable sort below only merges the sorted runs;
+    for equal timestamps, rows from earlier ranges stay first, as in the serial parser.
+    """
+    timestamps, weeks, days, columns, outcomes = [], [], [], [], []
+    sets_lists, recommended_lists = [], []
+    for range_timestamps, range_weeks, range_days, range_columns, range_outcomes, \
+            set_counts, set_values, recommended_counts, recommended_values in parsed_ranges:
+        timestamps.extend(range_timestamps)
+        weeks.extend(range_weeks)
+        days.extend(range_days)
+        columns.extend(range_columns)
+        outcomes.extend(range_outcomes)
+        for counts, values, lists in ((set_counts, set_values, sets_lists),
+                                      (recommended_counts, recommended_values, recommended_lists)):
+            values = values.tolist()
+            offsets = list(accumulate(counts, initial=0))
+            lists.extend(values[a:b] for a, b in zip(offsets, offsets[1:]))
+
+    order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    return [{
+        "timestamp": timestamps[i],
+        "week": weeks[i],
+        "day": days[i],
+        "column": columns[i],
+        "outcome": outcomes[i],
+        "sets_completed": sets_lists[i],
+        "sets_recommended": recommended_lists[i]
+    } for i in order]
+
+
+def load_attempt_logs_parallel(paths, workers=None):
+    """
+    Parses one or more attempt logs using a pool of worker processes and returns a list
+    with the attempts of each path, in the same format and order as get_attempts().
+    Each log is split at line boundaries into byte ranges, the ranges of all logs are parsed
+    in parallel, and the sorted results of each log are merged by timestamp
+    (see merge_parsed_ranges()), so the output is identical to the serial parser.
+    Only parsing runs in parallel: building the merged dictionaries happens in this process
+    and takes a large share of the total, which limits the speed-up on many cores.
+    workers defaults to PARALLEL_PARSE_WORKERS, or the number of CPU cores if that is None.
+    The pool is kept for later calls (see get_parse_pool()).
+    With a single worker or a single range there is nothing to gain, so each log is parsed
+    with parse_log_file() instead; the same happens if the worker processes die.
+    """
+    if workers is None:
+        workers = PARALLEL_PARSE_WORKERS or os.cpu_count() or 1
+
+    jobs = []  # (path index, fieldnames, start, end)
+    for path_idx, path in enumerate(paths):
+        if not os.path.isfile(path):
+            continue
+        # Several ranges per worker keep all cores busy when ranges parse at different speeds
+        num_ranges = max(1, min(workers * 4, os.path.getsize(path) // (256 * 1024)))
+        fieldnames, ranges = split_log_ranges(path, num_ranges)
+        for start, end in ranges:
+            jobs.append((path_idx, fieldnames, start, end))
+
+    if workers <= 1 or len(jobs) <= 1:
+        # Nothing to parallelize; the plain parser is faster than splitting and merging
+        return [parse_log_file(path) if os.path.isfile(path) else [] for path in paths]
+
+    parsed_by_path = [[] for _ in paths]
+    try:
+        pool = get_parse_pool(workers)
+        futures = [pool.submit(parse_log_range, paths[path_idx], fieldnames, start, end)
+                   for path_idx, fieldnames, start, end in jobs]
+        # Results are collected in file order, so the first bad row raises first
+        for (path_idx, _, _, _), future in zip(jobs, futures):
+            parsed_by_path[path_idx].append(future.result())
+    except BrokenProcessPool:
+        IO.print("The parser worker processes stopped unexpectedly; parsing in this process instead.")
+        shutdown_parse_pool()
+        return [parse_log_file(path) if os.path.isfile(path) else [] for path in paths]
+
+    # Building hundreds of thousands of lists and dictionaries triggers the cyclic garbage
+    # collector over and over, although none of them can form a cycle; pause it meanwhile.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        results = [merge_parsed_ranges(parsed_ranges) for parsed_ranges in parsed_by_path]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return results
+
+
+def get_parse_pool(workers):
+    """
+    Returns the process pool used by load_attempt_logs_parallel(), starting it on first use
+    (or again if the number of workers changed). The pool is shut down when the program exits.
+    Workers are started with "spawn" rather than forked, because forking while the background
+    writer thread holds a lock can leave the worker stuck on that lock.
+    """
+    global parse_pool
+    if parse_pool is not None and parse_pool[0] == workers:
+        return parse_pool[1]
+    if parse_pool is not None:
+        parse_pool[1].shutdown()
+    else:
+        atexit.register(shutdown_parse_pool)
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    parse_pool = (workers, pool)
+    return pool
+
+
+def shutdown_parse_pool():
+    """
+    Stops the worker processes of load_attempt_logs_parallel(), if they were started.
+    """
+    global parse_pool
+    if parse_pool is not None:
+        parse_pool[1].shutdown()
+        parse_pool = None
 
 
 def get_last_attempt():
@@ -429,12 +1767,12 @@ def show_progress_chart_by_date(suggest_test=False):
     If suggest_test=True, a note is added to the chart title.
     """
     if not plt:
-        print("matplotlib not available. Chart cannot be displayed.\n")
+        IO.print("matplotlib not available. Chart cannot be displayed.\n")
         return
 
     attempts = get_attempts()
     if not attempts:
-        print("No attempts found in the log.\n")
+        IO.print("No attempts found in the log.\n")
         return
 
     x_vals = range(len(attempts))
@@ -494,7 +1832,7 @@ def show_progress_chart_by_date(suggest_test=False):
                       linewidth=1)
 
     plt.tight_layout()
-    plt.show()
+    IO.show_chart()
 
 def print_last_attempt_info():
     """
@@ -505,30 +1843,30 @@ def print_last_attempt_info():
     """
     last_any = get_last_attempt()
     if not last_any:
-        print("No attempts have been logged yet.\n")
+        IO.print("No attempts have been logged yet.\n")
         return
 
-    print("=== Last Attempt ===")
-    print(f"Date/Time: {last_any['timestamp']}")
+    IO.print("=== Last Attempt ===")
+    IO.print(f"Date/Time: {last_any['timestamp']}")
     outcome = last_any["outcome"]
     if outcome == "TEST":
         max_pushups = sum(last_any["sets_completed"])
-        print(f"Recent attempt was a TEST: single-set max = {max_pushups}\n")
+        IO.print(f"Recent attempt was a TEST: single-set max = {max_pushups}\n")
     else:
         w, d, c = last_any["week"], last_any["day"], last_any["column"]
         sets_done = last_any["sets_completed"]
         total_pushups = sum(sets_done)
 
-        print(f"Week: {w}, Day: {d}, Column: {c}")
-        print(f"Outcome: {outcome}")
-        print(f"Sets Completed: {sets_done}")
-        print(f"Total Pushups: {total_pushups}\n")
+        IO.print(f"Week: {w}, Day: {d}, Column: {c}")
+        IO.print(f"Outcome: {outcome}")
+        IO.print(f"Sets Completed: {sets_done}")
+        IO.print(f"Total Pushups: {total_pushups}\n")
 
     last_normal = get_last_normal_attempt()
     if last_normal and last_normal["outcome"] == "SUCCESS":
         if (last_normal["week"] == 2 and last_normal["day"] == 3) \
            or (last_normal["week"] == 4 and last_normal["day"] == 3):
-            print("NOTE: The 100 Pushups Challenge recommends a TEST attempt "
+            IO.print("NOTE: The 100 Pushups Challenge recommends a TEST attempt "
                   f"after completing Week {last_normal['week']}, Day {last_normal['day']} successfully.\n")
 
 
@@ -555,11 +1893,11 @@ def show_next_session_preview(week, day, column, plan_data):
     entry = find_plan_entry(plan_data, week, day, column)
     if entry:
         sets_str = ", ".join(entry['sets'])
-        print(f"Upcoming Session: Week {week}, Day {day}, Column {column}")
-        print(f"Planned sets: {sets_str}")
-        print(f"Rest: {entry['rest']}\n")
+        IO.print(f"Upcoming Session: Week {week}, Day {day}, Column {column}")
+        IO.print(f"Planned sets: {sets_str}")
+        IO.print(f"Rest: {entry['rest']}\n")
     else:
-        print(f"No plan entry found for Week {week}, Day {day}, Column {column}.\n")
+        IO.print(f"No plan entry found for Week {week}, Day {day}, Column {column}.\n")
 
 
 def edit_log():
@@ -569,74 +1907,127 @@ def edit_log():
     and allows the user to remove or correct an entry. The code then rewrites the CSV file
     with the changes. If ENABLE_BACKUP is True, a backup is created before modifying the file.
     """
+    flush_background_writes()  # The rewritten log must not miss a queued attempt
     attempts = get_attempts()
     if not attempts:
-        print("No attempts in the log. Nothing to edit.")
+        IO.print("No attempts in the log. Nothing to edit.")
         return
 
-    print("\n--- Edit Attempt Log ---")
+    IO.print("\n--- Edit Attempt Log ---")
     for idx, a in enumerate(attempts):
-        print(f"{idx}: {a['timestamp']} | W{a['week']}D{a['day']} Col={a['column']} "
+        IO.print(f"{idx}: {a['timestamp']} | W{a['week']}D{a['day']} Col={a['column']} "
               f"Outcome={a['outcome']} Sets={a['sets_completed']}")
 
-    selection = input("\nEnter the index of the attempt to edit/remove (or 'cancel' to exit): ").strip().lower()
+    selection = IO.input("\nEnter the index of the attempt to edit/remove (or 'cancel' to exit): ").strip().lower()
     if selection == "cancel":
-        print("Edit canceled.")
+        IO.print("Edit canceled.")
         return
     try:
         choice_idx = int(selection)
         if choice_idx < 0 or choice_idx >= len(attempts):
-            print("Invalid index.")
+            IO.print("Invalid index.")
             return
     except ValueError:
-        print("Invalid selection.")
+        IO.print("Invalid selection.")
         return
 
     chosen_attempt = attempts[choice_idx]
-    print(f"Selected Attempt:\n{chosen_attempt}")
+    IO.print(f"Selected Attempt:\n{chosen_attempt}")
 
-    print("\nWhat would you like to do with this attempt?")
-    print("1) Remove the attempt (r)")
-    print("2) Modify the outcome (m)")
-    print("3) Cancel and do nothing (c)")
+    IO.print("\nWhat would you like to do with this attempt?")
+    IO.print("1) Remove the attempt (r)")
+    IO.print("2) Modify the outcome (m)")
+    IO.print("3) Cancel and do nothing (c)")
 
-    action = input("Enter your choice: ").strip().lower()
+    action = IO.input("Enter your choice: ").strip().lower()
     if action in ['1', 'r']:
         backup_log_file()  # Backup before removal
         del attempts[choice_idx]
-        print("Attempt removed.")
+        IO.print("Attempt removed.")
     elif action in ['2', 'm']:
-        new_outcome = input("Enter new outcome (SUCCESS, PARTIAL, INCOMPLETE, TEST): ").strip().upper()
+        new_outcome = IO.input("Enter new outcome (SUCCESS, PARTIAL, INCOMPLETE, TEST): ").strip().upper()
         if new_outcome not in ("SUCCESS", "PARTIAL", "INCOMPLETE", "TEST"):
-            print("Invalid outcome.")
+            IO.print("Invalid outcome.")
             return
         backup_log_file()  # Backup before modifying
-        chosen_attempt["outcome"] = new_outcome
-        print(f"Outcome changed to {new_outcome}.")
+        attempts[choice_idx] = dict(chosen_attempt, outcome=new_outcome)
+        IO.print(f"Outcome changed to {new_outcome}.")
     elif action in ['3', 'c']:
-        print("No changes made.")
+        IO.print("No changes made.")
         return
     else:
-        print("No valid action specified. No changes made.")
+        IO.print("No valid action specified. No changes made.")
         return
 
     try:
-        with open(ATTEMPT_LOG_CSV, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "week", "day", "column", "outcome", "sets_completed"])
-            for att in attempts:
-                sets_str = "|".join(map(str, att["sets_completed"]))
-                writer.writerow([
-                    att["timestamp"],
-                    att["week"],
-                    att["day"],
-                    att["column"],
-                    att["outcome"],
-                    sets_str
-                ])
-        print("Log updated successfully.")
+        write_all_attempts(attempts)
+        IO.print("Log updated successfully.")
     except Exception as e:
-        print(f"Error while updating log: {e}")
+        IO.print(f"Error while updating log: {e}")
+
+
+def rescore_log(plan_data):
+    """
+    Re-scores the whole attempt history with rescore_attempts(), for example after changing
+    PARTIAL_SUCCESS_ENABLED or correcting the plan CSV. Shows a report of every outcome that
+    would change and, if confirmed, rewrites the log. If ENABLE_BACKUP is True, a backup is
+    created before the log is modified.
+    """
+    flush_background_writes()  # The rewritten log must not miss a queued attempt
+    attempts = get_attempts()
+    if not attempts:
+        IO.print("No attempts in the log. Nothing to re-score.")
+        return
+
+    IO.print("\n--- Re-score Attempt History ---")
+    IO.print("1) Use the recommended reps stored with each attempt (s)")
+    IO.print("2) Use the recommended reps from the current plan (p)")
+    IO.print("3) Cancel and do nothing (c)")
+
+    action = IO.input("Enter your choice: ").strip().lower()
+    if action in ['1', 's']:
+        new_outcomes = rescore_attempts(attempts)
+    elif action in ['2', 'p']:
+        new_outcomes = rescore_attempts(attempts, plan_data)
+    else:
+        IO.print("No changes made.")
+        return
+
+    changes = []
+    transitions = {}
+    for idx, (a, new_outcome) in enumerate(zip(attempts, new_outcomes)):
+        if new_outcome is not None and new_outcome != a["outcome"]:
+            changes.append((idx, new_outcome))
+            key = (a["outcome"], new_outcome)
+            transitions[key] = transitions.get(key, 0) + 1
+    scored_count = sum(1 for o in new_outcomes if o is not None)
+    unscored_count = sum(1 for a, o in zip(attempts, new_outcomes) if o is None and a["outcome"] != "TEST")
+
+    IO.print(f"\nRe-scored {scored_count} attempt(s); {len(changes)} outcome(s) would change.")
+    if unscored_count:
+        IO.print(f"{unscored_count} attempt(s) have no recommended reps and were left unchanged.")
+    for idx, new_outcome in changes:
+        a = attempts[idx]
+        IO.print(f"{idx}: {a['timestamp']} | W{a['week']}D{a['day']} Col={a['column']} "
+              f"Sets={a['sets_completed']} {a['outcome']} -> {new_outcome}")
+    for (old_outcome, new_outcome), count in sorted(transitions.items()):
+        IO.print(f"  {old_outcome} -> {new_outcome}: {count}")
+    if not changes:
+        return
+
+    confirm = IO.input("\nApply these changes to the log? (y/n): ").strip().lower()
+    if confirm not in ["y", "yes"]:
+        IO.print("No changes made.")
+        return
+
+    backup_log_file()  # Backup before modifying
+    for idx, new_outcome in changes:
+        attempts[idx] = dict(attempts[idx], outcome=new_outcome)
+    try:
+        write_all_attempts(attempts)
+        IO.print("Log updated successfully.")
+    except Exception as e:
+        IO.print(f"Error while updating log: {e}")
 
 
 def do_test():
@@ -646,12 +2037,12 @@ def do_test():
     """
     while True:
         try:
-            val = int(input("Enter the maximum number of pushups in a single unbroken set: "))
+            val = int(IO.input("Enter the maximum number of pushups in a single unbroken set: "))
             if val < 0:
                 raise ValueError
             break
         except ValueError:
-            print("Enter a non-negative integer.")
+            IO.print("Enter a non-negative integer.")
     log_test_attempt(val)
 
 
@@ -664,11 +2055,17 @@ def main():
       4) Perform a TEST
       5) Edit/Remove Attempts in the log
       6) Exit
+      7) Restore the log from a backup
+      8) Re-score the attempt history
 
+    Verifies the attempt log against its checksums on startup, and stops if it is damaged.
     Shows the progress chart and last attempt info before each menu display.
     Also previews the planned sets for the next session.
     """
     plan_data = load_plan(PLAN_CSV)
+    import_legacy_backups()
+    if not check_log_integrity_at_startup():
+        return
 
     while True:
         # Check if a test suggestion is appropriate for the chart title
@@ -678,7 +2075,7 @@ def main():
             if (ln["week"] == 2 and ln["day"] == 3) or (ln["week"] == 4 and ln["day"] == 3):
                 suggest_test_flag = True
 
-        print("\nDisplaying the current progress chart (if any data is available)...")
+        IO.print("\nDisplaying the current progress chart (if any data is available)...")
         show_progress_chart_by_date(suggest_test=suggest_test_flag)
 
         print_last_attempt_info()
@@ -688,26 +2085,29 @@ def main():
             w_next, d_next, c_next = next_session_from_last_normal(ln)
             show_next_session_preview(w_next, d_next, c_next, plan_data)
 
-        print("MENU:")
-        print("1) Attempt the next session (based on last NON-TEST attempt)")
-        print("2) Repeat the last NON-TEST attempt")
-        print("3) Specify a session (Week/Day/Column)")
-        print("4) Perform a TEST (single-set max pushups)")
-        print("5) Edit/Remove attempts in the log")
-        print("6) Exit")
+        print_writer_messages()
+        IO.print("MENU:")
+        IO.print("1) Attempt the next session (based on last NON-TEST attempt)")
+        IO.print("2) Repeat the last NON-TEST attempt")
+        IO.print("3) Specify a session (Week/Day/Column)")
+        IO.print("4) Perform a TEST (single-set max pushups)")
+        IO.print("5) Edit/Remove attempts in the log")
+        IO.print("6) Exit")
+        IO.print("7) Restore the log from a backup")
+        IO.print("8) Re-score the attempt history")
 
-        choice = input("Enter menu choice: ").strip()
+        choice = IO.input("Enter menu choice: ").strip()
 
         if choice == "1":
             ln = get_last_normal_attempt()
             if not ln:
-                print("No normal (non-TEST) attempt found. Option 3 can specify an initial session.")
+                IO.print("No normal (non-TEST) attempt found. Option 3 can specify an initial session.")
                 continue
             w, d, c = next_session_from_last_normal(ln)
             plan_entry = find_plan_entry(plan_data, w, d, c)
             if not plan_entry:
-                print(f"No plan entry found for Week {w}, Day {d}, Column {c}.")
-                print("Try specifying a session manually.")
+                IO.print(f"No plan entry found for Week {w}, Day {d}, Column {c}.")
+                IO.print("Try specifying a session manually.")
                 continue
 
             # Preview upcoming session
@@ -715,36 +2115,36 @@ def main():
 
             set_data, completed_flag = do_session(plan_entry)
             outcome = determine_outcome(set_data, completed_flag)
-            log_attempt(w, d, c, set_data, outcome)
+            log_attempt(w, d, c, set_data, outcome, get_planned_reps(plan_entry))
 
         elif choice == "2":
             ln = get_last_normal_attempt()
             if not ln:
-                print("No normal (non-TEST) attempt to repeat.")
+                IO.print("No normal (non-TEST) attempt to repeat.")
                 continue
             w, d, c = ln["week"], ln["day"], ln["column"]
             plan_entry = find_plan_entry(plan_data, w, d, c)
             if not plan_entry:
-                print(f"No plan entry found for Week {w}, Day {d}, Column {c}.")
+                IO.print(f"No plan entry found for Week {w}, Day {d}, Column {c}.")
                 continue
 
             # Preview repeating session
-            print("\nRepeating the last session:")
+            IO.print("\nRepeating the last session:")
             show_next_session_preview(w, d, c, plan_data)
 
             set_data, completed_flag = do_session(plan_entry)
             outcome = determine_outcome(set_data, completed_flag)
-            log_attempt(w, d, c, set_data, outcome)
+            log_attempt(w, d, c, set_data, outcome, get_planned_reps(plan_entry))
 
         elif choice == "3":
             w = get_int_in_range("Enter Week (1-6): ", 1, 6)
             d = get_int_in_range("Enter Day (1-3): ", 1, 3)
             col = ""
             while col not in ["1", "2", "3"]:
-                col = input("Enter Column (1, 2, or 3): ").strip()
+                col = IO.input("Enter Column (1, 2, or 3): ").strip()
             plan_entry = find_plan_entry(plan_data, w, d, col)
             if not plan_entry:
-                print("No matching session was found in the plan.\n")
+                IO.print("No matching session was found in the plan.\n")
                 continue
 
             # Preview specified session
@@ -752,7 +2152,7 @@ def main():
 
             set_data, completed_flag = do_session(plan_entry)
             outcome = determine_outcome(set_data, completed_flag)
-            log_attempt(w, d, col, set_data, outcome)
+            log_attempt(w, d, col, set_data, outcome, get_planned_reps(plan_entry))
 
         elif choice == "4":
             do_test()
@@ -761,11 +2161,18 @@ def main():
             edit_log()
 
         elif choice == "6":
-            print("Exiting the 100 Pushups tracker.")
+            flush_background_writes()
+            IO.print("Exiting the 100 Pushups tracker.")
             break
 
+        elif choice == "7":
+            restore_log()
+
+        elif choice == "8":
+            rescore_log(plan_data)
+
         else:
-            print("Invalid choice. Please try again.")
+            IO.print("Invalid choice. Please try again.")
 
 
 def get_int_in_range(prompt, min_val, max_val):
@@ -774,13 +2181,232 @@ def get_int_in_range(prompt, min_val, max_val):
     """
     while True:
         try:
-            val = int(input(prompt))
+            val = int(IO.input(prompt))
             if val < min_val or val > max_val:
                 raise ValueError
             return val
         except ValueError:
-            print(f"Please enter an integer between {min_val} and {max_val}.")
+            IO.print(f"Please enter an integer between {min_val} and {max_val}.")
+
+
+class ReplayError(Exception):
+    """
+    Raised when a replay does not follow its transcript: a prompt is reached after the
+    transcript has run out, or the tracker exits before every answer was used.
+    """
+
+
+class ReplayIO(ConsoleIO):
+    """
+    Scripted user for replays and load tests. Answers prompts from a transcript (a list of
+    answers, as recorded with RECORD_TRANSCRIPT), discards output, and builds charts without
+    displaying them. It runs on a fake clock that advances by seconds_per_answer for every
+    answer (the time a user takes to respond) and by the time passed to sleep().
+    The wall-clock time of every menu iteration (from one "Enter menu choice" prompt to the
+    next) is collected in menu_latencies, in seconds.
+    """
+
+    def __init__(self, answers, start_time=None, seconds_per_answer=5):
+        self.answers = list(answers)
+        self.position = 0
+        self.clock = time.time() if start_time is None else start_time
+        self.seconds_per_answer = seconds_per_answer
+        self.menu_latencies = []
+        self.last_menu_prompt = None
+
+    def input(self, prompt=""):
+        if prompt.startswith("Enter menu choice"):
+            now = time.perf_counter()
+            if self.last_menu_prompt is not None:
+                self.menu_latencies.append(now - self.last_menu_prompt)
+        if self.position >= len(self.answers):
+            raise ReplayError(f"the transcript ran out after {len(self.answers)} answer(s), "
+                              f"at the prompt {prompt.strip()!r}")
+        answer = self.answers[self.position]
+        self.position += 1
+        self.clock += self.seconds_per_answer
+        if prompt.startswith("Enter menu choice"):
+            self.last_menu_prompt = time.perf_counter()
+        return answer
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def time(self):
+        return self.clock
+
+    def now(self):
+        return datetime.fromtimestamp(self.clock)
+
+    def show_chart(self):
+        plt.close("all")
+
+
+# A typical visit to the tracker, used by the benchmarks when no transcript is given:
+# a specified session with one rest timer, a TEST, repeating the session, viewing the
+# edit screen, and exiting. Week 1 Day 1 Column 1 has four regular sets and a final MAX set.
+DEFAULT_REPLAY_TRANSCRIPT = [
+    "3", "1", "1", "1", "", "y", "", "n", "", "n", "", "n", "4",
+    "4", "25",
+    "2", "", "n", "", "n", "", "n", "", "n", "3",
+    "5", "cancel",
+    "6",
+]
+
+
+def load_transcript(path):
+    """
+    Loads a recorded transcript: one answer per line (an empty line is a plain Enter).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.rstrip("\r\n") for line in f]
+
+
+def run_replay(answers, log_path=None, start_time=None):
+    """
+    Runs the full menu loop (main()) with a ReplayIO answering from the given transcript.
+    The replay uses the attempt log at log_path, or a temporary copy of ATTEMPT_LOG_CSV if
+    log_path is None, so the real log is never changed.
+    Raises ReplayError unless main() exits through the Exit menu item right after the last
+    answer, which catches transcripts that no longer match the prompts of the tracker.
+    Returns the ReplayIO, whose menu_latencies hold the time of each menu iteration.
+    """
+    global IO, ATTEMPT_LOG_CSV
+    saved_io, saved_log = IO, ATTEMPT_LOG_CSV
+    saved_backend = plt.get_backend() if plt is not None else None
+    replay = ReplayIO(answers, start_time)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if log_path is None:
+            log_path = os.path.join(tmp_dir, os.path.basename(ATTEMPT_LOG_CSV))
+            for src, dst in ((ATTEMPT_LOG_CSV, log_path), (checksum_file_path(), f"{log_path}.sums")):
+                if os.path.isfile(src):
+                    with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                        f_dst.write(f_src.read())
+        if plt is not None:
+            plt.switch_backend("Agg")  # Build charts without opening windows
+        IO = replay
+        ATTEMPT_LOG_CSV = log_path
+        try:
+            main()
+        finally:
+            flush_background_writes()
+            IO, ATTEMPT_LOG_CSV = saved_io, saved_log
+            if plt is not None:
+                plt.switch_backend(saved_backend)
+
+    unused = len(replay.answers) - replay.position
+    if unused:
+        raise ReplayError(f"the tracker exited with {unused} unused answer(s), starting with "
+                          f"answer {replay.position + 1}: {replay.answers[replay.position]!r}")
+    return replay
+
+
+def write_synthetic_log(path, num_attempts, plan_data, end_time):
+    """
+    Writes an attempt log with num_attempts plausible attempts, one hour apart and ending
+    at end_time, cycling through the plan entries of Column 1. Every tenth attempt is a TEST.
+    """
+    entries = [e for e in plan_data if e['column'] == "1"] or plan_data
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(LOG_FIELDS)
+        for i in range(num_attempts):
+            timestamp = datetime.fromtimestamp(end_time - (num_attempts - i) * 3600)
+            timestamp = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            if i % 10 == 9 or not entries:
+                writer.writerow([timestamp, -1, -1, "TEST", "TEST", str(20 + i % 30), ""])
+                continue
+            entry = entries[i % len(entries)]
+            planned = get_planned_reps(entry)
+            sets_str = "|".join(map(str, planned))
+            writer.writerow([timestamp, entry['week'], entry['day'], entry['column'],
+                             "SUCCESS", sets_str, sets_str])
+
+
+def percentile(sorted_values, pct):
+    """
+    Returns the pct-th percentile (nearest-rank method) of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(int(math.ceil(pct / 100.0 * len(sorted_values))), 1)
+    return sorted_values[rank - 1]
+
+
+def print_latency_summary(label, latencies):
+    """
+    Prints the count and p50/p90/p99/max of a list of latencies (in seconds) in milliseconds.
+    """
+    values = sorted(latencies)
+    IO.print(f"{label}: {len(values)} iterations | "
+             f"p50={percentile(values, 50) * 1000:.1f} ms  "
+             f"p90={percentile(values, 90) * 1000:.1f} ms  "
+             f"p99={percentile(values, 99) * 1000:.1f} ms  "
+             f"max={percentile(values, 100) * 1000:.1f} ms")
+
+
+def simulate_users(num_users, answers=None, log_size=0):
+    """
+    Replays the transcript (DEFAULT_REPLAY_TRANSCRIPT if None) for num_users simulated users
+    back to back. Each user starts with their own attempt log of log_size synthetic attempts
+    in a temporary directory. Returns the menu iteration latencies of all users.
+    Raises ReplayError if the default transcript is used but PLAN_CSV lacks the session it plays.
+    """
+    plan_data = load_plan(PLAN_CSV)
+    if answers is None:
+        if find_plan_entry(plan_data, 1, 1, "1") is None:
+            raise ReplayError(f"the default transcript needs a Week 1 Day 1 Column 1 session "
+                              f"in {PLAN_CSV}, which was not found")
+        answers = DEFAULT_REPLAY_TRANSCRIPT
+    start_time = time.time()
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for user in range(num_users):
+            log_path = os.path.join(tmp_dir, f"user{user}_attempt_log.csv")
+            write_synthetic_log(log_path, log_size, plan_data, start_time)
+            latencies.extend(run_replay(answers, log_path, start_time).menu_latencies)
+    return latencies
+
+
+def run_latency_benchmark(answers=None, log_sizes=(0, 100, 500), users_per_size=3):
+    """
+    Replays the transcript against attempt logs of increasing size and prints the
+    menu iteration latency percentiles for each size.
+    With matplotlib installed, drawing the chart (one bar per attempt) dominates: the
+    defaults take about a minute, and every 1000 attempts add roughly 45 seconds per user.
+    """
+    IO.print(f"Replaying {users_per_size} user(s) per log size.")
+    for log_size in log_sizes:
+        started = time.perf_counter()
+        latencies = simulate_users(users_per_size, answers, log_size)
+        elapsed = time.perf_counter() - started
+        print_latency_summary(f"{log_size:>7} attempts", latencies)
+        IO.print(f"{'':>16} total {elapsed:.2f} s")
 
 
 if __name__ == "__main__":
-    main()
+    # Usage:
+    #   python 100_pushups_simple.py                               interactive tracker
+    #   python 100_pushups_simple.py --replay TRANSCRIPT           replay a recorded transcript
+    #   python 100_pushups_simple.py --benchmark [TRANSCRIPT]      latency by log size
+    #   python 100_pushups_simple.py --simulate USERS [TRANSCRIPT] many users back to back
+    try:
+        if len(sys.argv) >= 3 and sys.argv[1] == "--replay":
+            replay = run_replay(load_transcript(sys.argv[2]))
+            print_latency_summary("Replay", replay.menu_latencies)
+        elif len(sys.argv) >= 2 and sys.argv[1] == "--benchmark":
+            run_latency_benchmark(load_transcript(sys.argv[2]) if len(sys.argv) >= 3 else None)
+        elif len(sys.argv) >= 3 and sys.argv[1] == "--simulate":
+            started = time.perf_counter()
+            latencies = simulate_users(int(sys.argv[2]),
+                                       load_transcript(sys.argv[3]) if len(sys.argv) >= 4 else None)
+            print_latency_summary(f"{sys.argv[2]} users", latencies)
+            IO.print(f"Total time: {time.perf_counter() - started:.2f} s")
+        else:
+            main()
+    except ReplayError as e:
+        IO.print(f"Replay failed: {e}")
+        sys.exit(1)
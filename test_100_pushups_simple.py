@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for 100_pushups_simple.py. Run with: python -m pytest -q
+Each test loads a fresh copy of the script and works in its own temporary directory.
+"""
+
+import csv
+import importlib.util
+import os
+import random
+import sys
+from concurrent.futures import Future
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(SCRIPT_DIR, "100_pushups_simple.py")
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Load the script under its own (importable) name, so worker processes can import it too
+    monkeypatch.syspath_prepend(SCRIPT_DIR)
+    spec = importlib.util.spec_from_file_location("100_pushups_simple", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    module.ENABLE_BACKGROUND_WRITER = False
+    return module
+
+
+def log_sessions(tracker, count):
+    for i in range(count):
+        tracker.log_attempt(1, 1 + i % 3, "1", [(3, 3), (2, 2), (4, 4)], "SUCCESS", [3, 2, 4])
+
+
+def flip_byte(path, offset):
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        value = f.read(1)[0]
+        f.seek(offset)
+        f.write(bytes([value ^ 1]))
+
+
+# -- Log checksums --
+
+def test_repair_restores_last_block_of_small_log(tracker):
+    log_sessions(tracker, 10)
+    size = os.path.getsize(tracker.ATTEMPT_LOG_CSV)
+    assert size < tracker.CHECKSUM_BLOCK_SIZE  # The whole log is a single block
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        original = f.read()
+
+    flip_byte(tracker.ATTEMPT_LOG_CSV, size - 10)
+    assert tracker.verify_log_integrity(full=True) == [(0, size)]
+    assert tracker.repair_log_from_backups()
+
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        assert f.read() == original
+    assert tracker.verify_log_integrity(full=True) == []
+    assert len(tracker.get_attempts()) == 10
+
+
+def test_truncation_is_detected_when_log_fills_whole_blocks(tracker):
+    log_sessions(tracker, 10)
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        original = f.read()
+    tracker.CHECKSUM_BLOCK_SIZE = len(original) // 2 if len(original) % 2 == 0 else len(original)
+    tracker.update_log_checksums(full_rebuild=True)
+    assert tracker.verify_log_integrity() == []
+    assert tracker.load_log_checksums()["verified_offset"] == len(original)
+
+    with open(tracker.ATTEMPT_LOG_CSV, "r+b") as f:
+        f.truncate(30)
+    assert tracker.verify_log_integrity() != []
+
+    # Logging another session must not hide the truncation by rebuilding the checksums
+    log_sessions(tracker, 1)
+    assert tracker.load_log_checksums()["length"] == len(original)
+    assert tracker.verify_log_integrity() != []
+
+    assert tracker.repair_log_from_backups()
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        assert f.read() == original
+
+
+def test_partially_written_row_is_reported_and_dropped(tracker):
+    log_sessions(tracker, 10)
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        original = f.read()
+    with open(tracker.ATTEMPT_LOG_CSV, "ab") as f:
+        f.write(b"2025-01-01 10:00:00,1,2")
+
+    assert tracker.verify_log_integrity() == [(len(original), len(original) + 23)]
+    assert tracker.repair_log_from_backups()
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        assert f.read() == original
+    assert len(tracker.get_attempts()) == 10
+
+
+def test_complete_rows_without_checksum_are_adopted(tracker):
+    log_sessions(tracker, 10)
+    with open(tracker.ATTEMPT_LOG_CSV, "ab") as f:
+        f.write(b"2025-01-01 10:00:00,1,2,1,SUCCESS,3|2|4,3|2|4\r\n")
+
+    assert tracker.verify_log_integrity() == []
+    sums = tracker.load_log_checksums()
+    assert sums["length"] == sums["verified_offset"] == os.path.getsize(tracker.ATTEMPT_LOG_CSV)
+    assert len(tracker.get_attempts()) == 11
+
+
+def run_main(tracker, monkeypatch, answers):
+    answers = iter(answers)
+    monkeypatch.setattr(tracker.IO, "input", lambda prompt="": next(answers))
+    monkeypatch.setattr(tracker, "plt", None)
+    tracker.main()
+    assert next(answers, None) is None
+
+
+def corrupt_first_week(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data.replace(b",1,1,1,SUCCESS,", b",x,1,1,SUCCESS,", 1))
+
+
+def test_main_stops_when_damage_is_not_repaired(tracker, monkeypatch, capsys):
+    log_sessions(tracker, 3)
+    corrupt_first_week(tracker.ATTEMPT_LOG_CSV)
+
+    run_main(tracker, monkeypatch, ["n"])
+    assert "the tracker cannot continue" in capsys.readouterr().out
+
+
+def test_main_stops_on_unparsable_log_without_checksums(tracker, monkeypatch, capsys):
+    log_sessions(tracker, 3)
+    os.remove(tracker.checksum_file_path())
+    corrupt_first_week(tracker.ATTEMPT_LOG_CSV)
+
+    run_main(tracker, monkeypatch, ["y"])
+    assert "the tracker cannot continue" in capsys.readouterr().out
+    assert not os.path.exists(tracker.checksum_file_path())
+
+
+def test_main_continues_after_successful_repair(tracker, monkeypatch, capsys):
+    log_sessions(tracker, 3)
+    corrupt_first_week(tracker.ATTEMPT_LOG_CSV)
+
+    run_main(tracker, monkeypatch, ["y", "6"])
+    assert "Exiting the 100 Pushups tracker." in capsys.readouterr().out
+    assert [a["week"] for a in tracker.get_attempts()] == [1, 1, 1]
+
+
+# -- Backup store --
+
+def test_every_backup_restores_the_version_it_was_taken_from(tracker):
+    snapshots = []
+    for _ in range(60):
+        log_sessions(tracker, 1)
+        with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+            snapshots.append(f.read())
+
+    backups = tracker.list_backups()
+    assert len(backups) == len(snapshots)
+    for backup, snapshot in zip(backups, snapshots):
+        assert tracker.read_backup(backup) == snapshot
+
+
+def test_backup_store_stays_small_and_uses_few_files(tracker):
+    log_sessions(tracker, 400)
+
+    store_dir = tracker.backup_store_path()
+    files = os.listdir(store_dir)
+    store_size = sum(os.path.getsize(os.path.join(store_dir, f)) for f in files)
+    assert sorted(files) == ["chunks.pack", "manifests.txt"]
+    assert store_size < 3 * os.path.getsize(tracker.ATTEMPT_LOG_CSV)
+
+
+def test_pruned_store_keeps_remaining_backups_readable(tracker):
+    tracker.MAX_BACKUPS = 20
+    snapshots = []
+    for _ in range(80):
+        log_sessions(tracker, 1)
+        with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+            snapshots.append(f.read())
+
+    backups = tracker.list_backups()
+    assert len(backups) == 20
+    for backup, snapshot in zip(backups, snapshots[-20:]):
+        assert tracker.read_backup(backup) == snapshot
+
+
+def test_interrupted_backup_write_is_ignored(tracker):
+    log_sessions(tracker, 3)
+    manifest_path = os.path.join(tracker.backup_store_path(), "manifests.txt")
+    with open(manifest_path, "ab") as f:
+        f.write(b"20990101_000000_000000 0 99")
+    pack_path = os.path.join(tracker.backup_store_path(), "chunks.pack")
+    with open(pack_path, "ab") as f:
+        f.write(b"\x00" * 10)
+
+    assert len(tracker.list_backups()) == 3
+    log_sessions(tracker, 1)
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        assert tracker.read_backup(tracker.list_backups()[-1]) == f.read()
+    assert len(tracker.list_backups()) == 4
+
+
+def test_restore_log_lists_backups_with_other_names(tracker, monkeypatch, capsys):
+    log_sessions(tracker, 1)
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        tracker.store_backup(f.read() + b"x", "manual-copy")
+    monkeypatch.setattr(tracker.IO, "input", lambda prompt: "cancel")
+
+    tracker.restore_log()
+    output = capsys.readouterr().out
+    assert "1: manual-copy |" in output
+    assert "Restore canceled." in output
+
+
+def test_old_backup_files_are_imported_into_the_store(tracker):
+    for i, name in enumerate(["20250101_120000", "20250102_120000_123456", "notes"]):
+        with open(f"{tracker.ATTEMPT_LOG_CSV}.{name}.bak", "wb") as f:
+            f.write(b"old log %d\n" % i)
+
+    tracker.import_legacy_backups()
+    assert tracker.list_backups() == ["20250101_120000_000000", "20250102_120000_123456"]
+    assert tracker.read_backup("20250102_120000_123456") == b"old log 1\n"
+    assert sorted(os.listdir(".")) == [f"{tracker.ATTEMPT_LOG_CSV}.backups", f"{tracker.ATTEMPT_LOG_CSV}.notes.bak"]
+
+
+# -- Reading the log --
+
+def test_attempts_are_parsed_once_until_the_log_changes(tracker, monkeypatch):
+    log_sessions(tracker, 3)
+    first = tracker.get_attempts()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("log was parsed again")
+    with monkeypatch.context() as patch:
+        patch.setattr(tracker.csv, "DictReader", fail)
+        second = tracker.get_attempts()
+    assert second == first and second is not first
+
+    log_sessions(tracker, 1)
+    assert len(tracker.get_attempts()) == 4
+
+
+def write_large_log(path, num_rows, seed=3):
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "week", "day", "column", "outcome", "sets_completed", "sets_recommended"])
+        for _ in range(num_rows):
+            sets = "|".join(str(rng.randint(0, 20)) for _ in range(rng.randint(1, 5)))
+            writer.writerow([f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00",
+                             rng.randint(1, 6), rng.randint(1, 3), str(rng.randint(1, 3)),
+                             rng.choice(["SUCCESS", "PARTIAL", "INCOMPLETE"]), sets, sets])
+
+
+def test_parallel_parser_matches_serial_parser(tracker):
+    write_large_log(tracker.ATTEMPT_LOG_CSV, 20000)
+    assert os.path.getsize(tracker.ATTEMPT_LOG_CSV) > 512 * 1024
+    serial = tracker.parse_log_file(tracker.ATTEMPT_LOG_CSV)
+    try:
+        parallel = tracker.load_attempt_logs_parallel([tracker.ATTEMPT_LOG_CSV], workers=2)[0]
+        assert tracker.parse_pool is not None  # The ranges really went to worker processes
+    finally:
+        tracker.shutdown_parse_pool()
+    assert parallel == serial
+
+
+def test_parallel_parser_falls_back_when_workers_die(tracker, monkeypatch):
+    write_large_log(tracker.ATTEMPT_LOG_CSV, 20000)
+
+    class BrokenPool:
+        def submit(self, *args):
+            future = Future()
+            future.set_exception(tracker.BrokenProcessPool("worker died"))
+            return future
+        def shutdown(self):
+            pass
+    monkeypatch.setattr(tracker, "get_parse_pool", lambda workers: BrokenPool())
+
+    parallel = tracker.load_attempt_logs_parallel([tracker.ATTEMPT_LOG_CSV], workers=2)[0]
+    assert parallel == tracker.parse_log_file(tracker.ATTEMPT_LOG_CSV)
+
+
+def test_cached_attempts_belong_to_one_log(tracker, tmp_path):
+    log_sessions(tracker, 2)
+    tracker.get_attempts()
+    other_log = str(tmp_path / "other_log.csv")
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as src, open(other_log, "wb") as dst:
+        dst.write(src.read().replace(b",SUCCESS,", b",PARTIAL,"))
+    os.utime(other_log, ns=(0, os.stat(tracker.ATTEMPT_LOG_CSV).st_mtime_ns))
+
+    tracker.ATTEMPT_LOG_CSV = other_log
+    assert [a["outcome"] for a in tracker.get_attempts()] == ["PARTIAL", "PARTIAL"]
+
+
+# -- Background writer --
+
+def test_queued_attempt_is_visible_before_it_is_written(tracker, capsys):
+    tracker.ENABLE_BACKGROUND_WRITER = True
+    release = tracker.threading.Event()
+    tracker.run_in_background(release.wait)  # Keeps the writer busy
+
+    log_sessions(tracker, 1)
+    assert [a["outcome"] for a in tracker.get_attempts()] == ["SUCCESS"]
+    assert not os.path.exists(tracker.ATTEMPT_LOG_CSV)
+    assert "Logged attempt" not in capsys.readouterr().out
+
+    release.set()
+    tracker.write_queue.join()  # The write is done, but its message waits for the main thread
+    assert "Logged attempt" not in capsys.readouterr().out
+    tracker.flush_background_writes()
+    output = capsys.readouterr().out
+    assert "Logged attempt: SUCCESS => 3|2|4" in output
+    assert "Backup created" not in output
+    assert tracker.pending_rows == []
+    assert len(tracker.get_attempts()) == 1
+
+
+# -- Re-scoring --
+
+def random_attempts(count, seed=7):
+    rng = random.Random(seed)
+    attempts = []
+    for i in range(count):
+        recommended = [rng.randint(1, 12) for _ in range(rng.randint(0, 6))]
+        actual = [max(0, r + rng.randint(-3, 2)) for r in recommended[:rng.randint(0, len(recommended))]]
+        attempts.append({
+            "timestamp": f"2025-01-01 00:00:{i:02d}",
+            "week": 1, "day": 1, "column": "1",
+            "outcome": "TEST" if i % 17 == 0 else "SUCCESS",
+            "sets_completed": actual,
+            "sets_recommended": recommended,
+        })
+    return attempts
+
+
+def expected_outcome(tracker, attempt):
+    actual, recommended = attempt["sets_completed"], attempt["sets_recommended"]
+    if attempt["outcome"] == "TEST" or not recommended:
+        return None
+    return tracker.determine_outcome(list(zip(actual, recommended)), len(actual) >= len(recommended))
+
+
+@pytest.mark.parametrize("partial_enabled", [True, False])
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_rescore_matches_determine_outcome(tracker, monkeypatch, use_numpy, partial_enabled):
+    if use_numpy and tracker.np is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(tracker, "np", None)
+    tracker.PARTIAL_SUCCESS_ENABLED = partial_enabled
+    attempts = random_attempts(60)
+
+    expected = [expected_outcome(tracker, a) for a in attempts]
+    assert tracker.rescore_attempts(attempts) == expected
+    assert {"SUCCESS", "INCOMPLETE", None} <= set(expected)
+
+
+def test_early_stopped_session_is_not_rescored_as_success(tracker):
+    tracker.log_attempt(1, 1, "1", [(3, 3), (2, 2)], "INCOMPLETE", [3, 2, 4])
+    assert tracker.rescore_attempts(tracker.get_attempts()) == ["INCOMPLETE"]
+
+
+def test_rescore_uses_current_plan_when_given(tracker):
+    tracker.log_attempt(1, 1, "1", [(3, 3), (2, 2)], "SUCCESS", [3, 2])
+    plan_data = [{"week": 1, "day": 1, "column": "1", "sets": ["4", "2"], "rest": "60"}]
+    assert tracker.rescore_attempts(tracker.get_attempts()) == ["SUCCESS"]
+    assert tracker.rescore_attempts(tracker.get_attempts(), plan_data) == ["PARTIAL"]
+
+
+def test_rescore_log_rewrites_changed_outcomes(tracker, monkeypatch):
+    tracker.log_attempt(1, 1, "1", [(3, 3), (1, 2), (4, 4)], "SUCCESS", [3, 2, 4])
+    tracker.log_attempt(1, 2, "1", [(3, 3), (2, 2), (4, 4)], "SUCCESS", [3, 2, 4])
+    answers = iter(["1", "y"])
+    monkeypatch.setattr(tracker.IO, "input", lambda prompt: next(answers))
+
+    tracker.rescore_log([])
+    assert [a["outcome"] for a in tracker.get_attempts()] == ["PARTIAL", "SUCCESS"]
+    assert tracker.verify_log_integrity(full=True) == []
+
+
+def test_old_log_is_upgraded_and_its_attempts_are_left_unscored(tracker):
+    with open(tracker.ATTEMPT_LOG_CSV, "w", newline="", encoding="utf-8") as f:
+        f.write("timestamp,week,day,column,outcome,sets_completed\r\n")
+        f.write("2024-01-01 10:00:00,1,1,1,SUCCESS,3|2|4\r\n")
+    log_sessions(tracker, 1)
+
+    with open(tracker.ATTEMPT_LOG_CSV, encoding="utf-8") as f:
+        assert f.readline().strip() == ",".join(tracker.LOG_FIELDS)
+    attempts = tracker.get_attempts()
+    assert attempts[0]["sets_recommended"] == []
+    assert tracker.rescore_attempts(attempts) == [None, "SUCCESS"]
+
+
+# -- Replay harness --
+
+def test_replay_without_log_path_leaves_the_real_log_alone(tracker):
+    log_sessions(tracker, 2)
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        before = f.read()
+
+    backend = tracker.plt.get_backend() if tracker.plt is not None else None
+    tracker.run_replay(["4", "25", "6"])
+    with open(tracker.ATTEMPT_LOG_CSV, "rb") as f:
+        assert f.read() == before
+    assert tracker.IO.__class__ is tracker.ConsoleIO
+    if tracker.plt is not None:
+        assert tracker.plt.get_backend() == backend
+
+
+def test_replay_reports_transcript_drift(tracker, tmp_path):
+    log_path = str(tmp_path / "replay_log.csv")
+    with pytest.raises(tracker.ReplayError, match="ran out"):
+        tracker.run_replay(["4"], log_path)
+    with pytest.raises(tracker.ReplayError, match="1 unused answer"):
+        tracker.run_replay(["6", "4"], log_path)
+
+
+def test_replay_clock_advances_with_every_answer(tracker, tmp_path):
+    log_path = str(tmp_path / "replay_log.csv")
+    tracker.run_replay(["4", "25", "4", "30", "6"], log_path, start_time=1700000000)
+
+    tracker.ATTEMPT_LOG_CSV = log_path
+    timestamps = [a["timestamp"] for a in tracker.get_attempts()]
+    assert len(timestamps) == 2 and timestamps[0] < timestamps[1]
+
+
+def test_simulation_without_plan_reports_the_missing_session(tracker):
+    with pytest.raises(tracker.ReplayError, match="Week 1 Day 1 Column 1"):
+        tracker.simulate_users(1)